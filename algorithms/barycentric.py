@@ -1,168 +1,133 @@
-import time, sys
-from sympy import symbols, expand, Poly
-from utils.string_manipulation import to_digit_superscript
+import numpy as np
+from algorithms.coefficients import barycentric_to_monomial, exact_monomial_coefficients
+from algorithms.stability import max_relative_error
+from algorithms.memory import memory_usage_kb
+from utils.profiling import profiler
+from utils.string_manipulation import to_unicode_poly_string
 
 class BarycentricInterpolator:
+    # Filled lazily by get_polynomial_expression(); not counted by get_memory_usage().
+    CACHE_ATTRIBUTES = ("coefficients",)
+
     def __init__(self, x_vals, y_vals):
-        self.x_vals = list(map(float, x_vals))
-        self.y_vals = list(map(float, y_vals))
-        self.n = len(self.x_vals)
-        self.weights = self._compute_weights()
-        self.interpolation_eval_time = 0
-        self.construction_time = 0
+        with profiler.span("construct"):
+            self.x_vals = list(map(float, x_vals))
+            self.y_vals = list(map(float, y_vals))
+            self.n = len(self.x_vals)
+            self.weights = self._compute_weights()
+            self.coefficients = None
 
     def _compute_weights(self):
-        w = [1.0] * self.n
-        for j in range(self.n):
-            xj = self.x_vals[j]
-            for k in range(self.n):
-                if j != k:
-                    diff = xj - self.x_vals[k]
-                    if diff == 0:
-                        raise ZeroDivisionError("Duplicate x-values encountered.")
-                    w[j] /= diff
-        return w
+        with profiler.span("weights"):
+            w = [1.0] * self.n
+            for j in range(self.n):
+                xj = self.x_vals[j]
+                for k in range(self.n):
+                    if j != k:
+                        diff = xj - self.x_vals[k]
+                        if diff == 0:
+                            raise ZeroDivisionError("Duplicate x-values encountered.")
+                        w[j] /= diff
+            return w
+
+    def add_point(self, x, y):
+        with profiler.span("weights"):
+            x = float(x)
+            if x in self.x_vals:
+                raise ZeroDivisionError("Duplicate x-values encountered.")
+
+            new_weight = 1.0
+            for j in range(self.n):
+                diff = self.x_vals[j] - x
+                self.weights[j] /= diff
+                new_weight /= -diff
+
+            self.x_vals.append(x)
+            self.y_vals.append(float(y))
+            self.weights.append(new_weight)
+            self.n += 1
+            self.coefficients = None
+
+    def remove_point(self, i):
+        with profiler.span("weights"):
+            xi = self.x_vals[i]
+            for j in range(self.n):
+                if j != i:
+                    self.weights[j] *= self.x_vals[j] - xi
+
+            del self.x_vals[i]
+            del self.y_vals[i]
+            del self.weights[i]
+            self.n -= 1
+            self.coefficients = None
+
+    def update_y(self, i, y):
+        self.y_vals[i] = float(y)
+        self.coefficients = None
 
     def interpolate(self, x):
-        start = time.perf_counter()
-        x = float(x)
+        with profiler.span("evaluate"):
+            x = float(x)
+
+            for j in range(self.n):
+                if x == self.x_vals[j]:
+                    return self.y_vals[j]
 
-        for j in range(self.n):
-            if x == self.x_vals[j]:
-                return self.y_vals[j]
+            numerator = 0.0
+            denominator = 0.0
+            for j in range(self.n):
+                temp = self.weights[j] / (x - self.x_vals[j])
+                numerator += temp * self.y_vals[j]
+                denominator += temp
 
-        numerator = 0.0
-        denominator = 0.0
-        for j in range(self.n):
-            temp = self.weights[j] / (x - self.x_vals[j])
-            numerator += temp * self.y_vals[j]
-            denominator += temp
+            return numerator / denominator if denominator != 0 else 0.0
 
-        end = time.perf_counter()
-        self.interpolation_eval_time += end - start
+    def _interpolate_many_values(self, xs, values):
+        nodes = np.asarray(self.x_vals)
 
-        return numerator / denominator if denominator != 0 else 0.0
+        diff = xs[..., None] - nodes
+        exact = diff == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            temp = np.asarray(self.weights) / np.where(exact, 1.0, diff)
+            numerator = temp @ values
+            denominator = temp.sum(axis=-1)
+            result = np.where(denominator != 0, numerator / denominator, 0.0)
 
-    def _compute_polynomial_coefficients(self):
-        poly = [0.0] * self.n
+        hit = exact.any(axis=-1)
+        result[hit] = values[exact.argmax(axis=-1)[hit]]
+        return result
 
-        for j in range(self.n):
-            term_poly = [1.0]
-            for m in range(self.n):
-                if m != j:
-                    next_term = [0.0] * (len(term_poly) + 1)
-                    for i in range(len(term_poly)):
-                        next_term[i] -= term_poly[i] * self.x_vals[m]
-                        next_term[i + 1] += term_poly[i]
-                    term_poly = next_term
+    def interpolate_many(self, xs):
+        with profiler.span("evaluate"):
+            return self._interpolate_many_values(np.asarray(xs, dtype=float), np.asarray(self.y_vals))
 
-            weight_y = self.weights[j] * self.y_vals[j]
-            for i in range(len(term_poly)):
-                poly[i] += weight_y * term_poly[i]
+    def _compute_polynomial_coefficients(self, exact=False):
+        if exact:
+            return exact_monomial_coefficients(self.x_vals, self.y_vals)
 
-        return poly
+        if self.coefficients is None:
+            self.coefficients = barycentric_to_monomial(self.x_vals, self.weights, self.y_vals)
+        return self.coefficients
 
     def _format_polynomial_expression(self, coefficients):
-        x = symbols("x")
-        poly_expr = sum(coeff * x**i for i, coeff in enumerate(coefficients))
-        poly_expr = expand(poly_expr)
-
-        def to_unicode_poly_string(poly):
-            terms = []
-            poly = Poly(poly, x)
-            coeffs = poly.all_coeffs()
-            deg = len(coeffs) - 1
-
-            for i, coeff in enumerate(coeffs):
-                power = deg - i
-                if coeff == 0:
-                    continue
-                sign = "-" if coeff < 0 else "+"
-                abs_coeff = abs(coeff)
-                coeff_str = f"{abs_coeff:.4f}".rstrip("0").rstrip(".") if abs_coeff != 1 or power == 0 else ""
-
-                if power == 0:
-                    term = f"{coeff_str}"
-                elif power == 1:
-                    term = f"{coeff_str}x"
-                else:
-                    term = f"{coeff_str}x{to_digit_superscript(power)}"
-
-                terms.append((sign, term))
-
-            if not terms:
-                return "0"
-
-            result = terms[0][1] if terms[0][0] == "+" else f"-{terms[0][1]}"
-            for sign, term in terms[1:]:
-                result += f" {sign} {term}"
-
-            return result
-
-        return f"B(x) = {to_unicode_poly_string(poly_expr)}"
-
-    def get_numerical_stability(self, perturbation=1e-5, num_samples=1000):
-        perturbed_y_vals = [y + perturbation for y in self.y_vals]
-        perturbed_interpolator = BarycentricInterpolator(self.x_vals, perturbed_y_vals)
-
-        min_x = min(self.x_vals)
-        max_x = max(self.x_vals)
+        return f"B(x) = {to_unicode_poly_string(coefficients)}"
+
+    def get_numerical_stability(self, perturbation=1e-5, num_samples=1000, x_samples=None, y_samples=None):
         if self.n == 1:
             return 0.0
 
-        max_relative_error = 0.0
-        for i in range(num_samples):
-            x_sample = min_x + i * (max_x - min_x) / (num_samples - 1)
-            orig_val = self.interpolate(x_sample)
-            perturbed_val = perturbed_interpolator.interpolate(x_sample)
-
-            if orig_val != 0:
-                rel_error = abs((perturbed_val - orig_val) / orig_val)
-            else:
-                rel_error = abs(perturbed_val - orig_val)
-
-            max_relative_error = max(max_relative_error, rel_error)
-
-        return max_relative_error
-
-    def get_polynomial_expression(self):
-        start_time = time.perf_counter()
-        coefficients = self._compute_polynomial_coefficients()
-        polynomial_expression = self._format_polynomial_expression(coefficients)
-        end_time = time.perf_counter()
-        self.construction_time = end_time - start_time
-
-        return polynomial_expression
+        with profiler.span("stability"):
+            if x_samples is None or y_samples is None:
+                x_samples = np.linspace(min(self.x_vals), max(self.x_vals), num_samples)
+                y_samples = self._interpolate_many_values(x_samples, np.asarray(self.y_vals))
 
-    def get_interpolation_time(self):
-        return self.construction_time + self.interpolation_eval_time
+            shift_samples = perturbation * self._interpolate_many_values(np.asarray(x_samples, dtype=float), np.ones(self.n))
+            return max_relative_error(y_samples, shift_samples)
 
-    def get_evaluation_only_time(self):
-        return self.interpolation_eval_time
+    def get_polynomial_expression(self, exact=False):
+        with profiler.span("coefficients"):
+            coefficients = self._compute_polynomial_coefficients(exact)
+            return self._format_polynomial_expression(coefficients)
 
     def get_memory_usage(self):
-        def deep_getsizeof(obj, seen_ids=set()):
-            if id(obj) in seen_ids:
-                return 0
-            seen_ids.add(id(obj))
-            size = sys.getsizeof(obj)
-
-            if isinstance(obj, dict):
-                size += sum(deep_getsizeof(k, seen_ids) + deep_getsizeof(v, seen_ids) for k, v in obj.items())
-            elif isinstance(obj, (list, tuple, set)):
-                size += sum(deep_getsizeof(i, seen_ids) for i in obj)
-
-            return size
-
-        total = 0
-        total += deep_getsizeof(self.x_vals)
-        total += deep_getsizeof(self.y_vals)
-        total += deep_getsizeof(self.weights)
-
-        try:
-            coeffs = self._compute_polynomial_coefficients()
-            total += deep_getsizeof(coeffs)
-        except Exception:
-            pass
-
-        return round(total / 1024, 2)
\ No newline at end of file
+        return memory_usage_kb(self)
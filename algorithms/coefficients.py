@@ -0,0 +1,84 @@
+import numpy as np
+
+def newton_to_monomial(divided_diffs, x_vals):
+    """
+    Expands the Newton form c₀ + c₁(x - x₀) + ... by nested multiplication.
+    Returns monomial coefficients in ascending order of degree.
+    """
+    n = len(divided_diffs)
+    coeffs = np.zeros(n)
+    coeffs[0] = divided_diffs[n - 1]
+
+    for i in range(n - 2, -1, -1):
+        coeffs[1:] = coeffs[:-1] - x_vals[i] * coeffs[1:]
+        coeffs[0] = divided_diffs[i] - x_vals[i] * coeffs[0]
+
+    return coeffs.tolist()
+
+def barycentric_to_monomial(x_vals, weights, y_vals):
+    """
+    Sums wₖyₖ · ℓ(x)/(x - xₖ) for the node polynomial ℓ(x) = Π (x - xₖ),
+    which is expanded once and deflated by every node at the same time,
+    one degree per step, for O(n²) work overall.
+
+    Deflation is composite: quotient coefficients above the largest term
+    of ℓ(xₖ) come from forward synthetic division and the rest from
+    backward division, which keeps the rounding comparable to expanding
+    each basis product directly.
+    Returns monomial coefficients in ascending order of degree.
+    """
+    nodes = np.asarray(x_vals, dtype=float)
+    scaled_y = np.asarray(weights, dtype=float) * np.asarray(y_vals, dtype=float)
+    node_poly = np.poly(nodes)
+    n = len(nodes)
+
+    with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+        log_coeffs = np.log(np.abs(node_poly))
+        log_nodes = np.log(np.abs(nodes))
+        largest = np.full(n, -np.inf)
+        split = np.zeros(n, dtype=int)
+        for i in range(n + 1):
+            term = np.nan_to_num(log_coeffs[i] + (n - i) * log_nodes, nan=-np.inf)
+            larger = term > largest
+            largest[larger] = term[larger]
+            split[larger] = i
+        split[nodes == 0] = n
+
+        coeffs = np.zeros(n)
+        quotients = np.zeros(n)
+        for k in range(n):
+            quotients = node_poly[k] + nodes * quotients
+            forward = k < split
+            coeffs[k] += scaled_y[forward] @ quotients[forward]
+
+        quotients = np.zeros(n)
+        nonzero_nodes = np.where(nodes == 0, 1.0, nodes)
+        for k in range(n - 1, -1, -1):
+            quotients = (quotients - node_poly[k + 1]) / nonzero_nodes
+            backward = k >= split
+            coeffs[k] += scaled_y[backward] @ quotients[backward]
+
+    return coeffs[::-1].tolist()
+
+def exact_monomial_coefficients(x_vals, y_vals):
+    """
+    Exact-arithmetic mode: divided differences over SymPy rationals, so
+    the only rounding happens when the result is converted back to float.
+    SymPy is imported here so the numeric path never loads it.
+    """
+    from sympy import Rational, Poly, symbols
+
+    x = symbols("x")
+    nodes = [Rational(v) for v in x_vals]
+    coeffs = [Rational(v) for v in y_vals]
+    n = len(nodes)
+
+    for j in range(1, n):
+        for i in range(n - 1, j - 1, -1):
+            coeffs[i] = (coeffs[i] - coeffs[i - 1]) / (nodes[i] - nodes[i - j])
+
+    poly = Poly(coeffs[n - 1], x)
+    for i in range(n - 2, -1, -1):
+        poly = poly * Poly(x - nodes[i], x) + coeffs[i]
+
+    return [float(c) for c in reversed(poly.all_coeffs())]
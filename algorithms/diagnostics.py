@@ -0,0 +1,84 @@
+import numpy as np
+
+def _log_weights(nodes):
+    """
+    Barycentric weight magnitudes as log|wₖ|, so that large n does not
+    overflow the products.
+    """
+    diffs = nodes[:, None] - nodes[None, :]
+    np.fill_diagonal(diffs, 1.0)
+    return -np.log(np.abs(diffs)).sum(axis=1)
+
+def lebesgue_function(x_vals, xs, chunk_size=4096):
+    """
+    λ(x) = Σ |ℓₖ(x)| = |ℓ(x)| · Σ |wₖ| / |x - xₖ| with ℓ(x) = Π (x - xₖ).
+    |ℓ(x)| and the weight scale are combined in log space and the sum has
+    only positive terms, so nothing cancels or overflows early. Evaluated
+    in chunks of `chunk_size` grid points to bound the temporary n × chunk
+    array; returns inf beyond float range.
+    """
+    nodes = np.asarray(x_vals, dtype=float)
+    xs = np.asarray(xs, dtype=float)
+    log_weights = _log_weights(nodes)
+    scale = log_weights.max()
+    weights = np.exp(log_weights - scale)
+    result = np.empty_like(xs)
+
+    for start in range(0, len(xs), chunk_size):
+        chunk = xs[start:start + chunk_size]
+        distance = np.abs(chunk[:, None] - nodes)
+        exact = (distance == 0).any(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            log_node_poly = np.log(distance).sum(axis=1)
+            values = np.exp(log_node_poly + scale) * (weights / distance).sum(axis=1)
+        values[exact] = 1.0
+        result[start:start + chunk_size] = values
+
+    return result
+
+def lebesgue_constant(x_vals, num_samples=None, chunk_size=4096):
+    """Maximum of λ over a uniform grid of `num_samples` points, by default at least 20 per node."""
+    if len(x_vals) < 2:
+        return 1.0
+    num_samples = num_samples or max(10000, 20 * len(x_vals))
+    xs = np.linspace(min(x_vals), max(x_vals), num_samples)
+    return float(np.max(lebesgue_function(x_vals, xs, chunk_size)))
+
+def newton_condition_estimate(x_vals):
+    """
+    ∞-norm condition number of the lower-triangular Newton basis matrix
+    N[i, k] = Π_{j<k} (xᵢ - xⱼ), whose inverse is the divided-difference map
+    from y-values to coefficients. Returns inf when the products overflow.
+    """
+    nodes = np.asarray(x_vals, dtype=float)
+    n = len(nodes)
+    if n < 2:
+        return 1.0
+
+    diffs = nodes[:, None] - nodes[None, :]
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        basis = np.ones((n, n))
+        basis[:, 1:] = np.cumprod(diffs[:, :-1], axis=1)
+        basis = np.tril(basis)
+
+        np.fill_diagonal(diffs, 1.0)
+        divided = np.tril((1.0 / np.cumprod(diffs, axis=1)).T)
+
+        condition = np.abs(basis).sum(axis=1).max() * np.abs(divided).sum(axis=1).max()
+
+    return float(condition) if np.isfinite(condition) else float("inf")
+
+def barycentric_weight_range(x_vals):
+    """Ratio of the largest to the smallest barycentric weight magnitude."""
+    if len(x_vals) < 2:
+        return 1.0
+    log_magnitudes = _log_weights(np.asarray(x_vals, dtype=float))
+    with np.errstate(over="ignore"):
+        return float(np.exp(log_magnitudes.max() - log_magnitudes.min()))
+
+def compute_diagnostics(x_vals, num_samples=None):
+    return {
+        "lebesgue_constant": lebesgue_constant(x_vals, num_samples),
+        "newton_condition": newton_condition_estimate(x_vals),
+        "weight_range": barycentric_weight_range(x_vals),
+    }
@@ -1,14 +1,33 @@
-import time
-from collections import defaultdict
-from sympy import symbols, expand, Poly
-from utils.string_manipulation import to_digit_superscript
+import numpy as np
+from algorithms.coefficients import barycentric_to_monomial, exact_monomial_coefficients
+from algorithms.stability import max_relative_error
+from algorithms.memory import memory_usage_kb
+from utils.profiling import profiler
+from utils.string_manipulation import to_unicode_poly_string
 
 class LagrangeInterpolator:
-    def __init__(self, x_vals, y_vals):
-        self.x_vals = [float(x) for x in x_vals]
-        self.y_vals = [float(y) for y in y_vals]
-        self.n = len(x_vals)
-        self.interpolation_eval_time = 0
+    MODES = ("fast", "reference")
+
+    def __init__(self, x_vals, y_vals, mode="fast"):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown Lagrange evaluation mode: {mode}")
+
+        with profiler.span("construct"):
+            self.x_vals = [float(x) for x in x_vals]
+            self.y_vals = [float(y) for y in y_vals]
+            self.n = len(x_vals)
+            self.mode = mode
+            self.scale = (max(self.x_vals) - min(self.x_vals)) / 4 if self.n > 1 else 1.0
+            self.denominators = self._compute_denominators()
+
+    def _compute_denominators(self):
+        with profiler.span("weights"):
+            denominators = [1.0] * self.n
+            for k in range(self.n):
+                for i in range(self.n):
+                    if i != k:
+                        denominators[k] *= (self.x_vals[k] - self.x_vals[i]) / self.scale
+            return denominators
 
     def _L(self, k, x):
         total = 1.0
@@ -17,112 +36,84 @@ class LagrangeInterpolator:
                 total *= (x - self.x_vals[i]) / (self.x_vals[k] - self.x_vals[i])
         return total
 
-    def interpolate(self, x):
-        start = time.perf_counter()
-
+    def _interpolate_reference(self, x):
         result = 0.0
         for k in range(self.n):
             result += self.y_vals[k] * self._L(k, x)
+        return result
 
-        end = time.perf_counter()
-        self.interpolation_eval_time += end - start
+    def _interpolate_fast(self, x):
+        node_poly = 1.0
+        total = 0.0
+        for k in range(self.n):
+            diff = (x - self.x_vals[k]) / self.scale
+            if diff == 0:
+                return self.y_vals[k]
+            node_poly *= diff
+            total += self.y_vals[k] / (self.denominators[k] * diff)
+        return node_poly * total
 
+    def interpolate(self, x):
+        with profiler.span("evaluate"):
+            if self.mode == "reference":
+                return self._interpolate_reference(x)
+            return self._interpolate_fast(float(x))
+
+    def _interpolate_many_reference(self, xs, values):
+        nodes = np.asarray(self.x_vals)
+        result = np.zeros_like(xs)
+        for k in range(self.n):
+            others = np.delete(nodes, k)
+            basis = np.prod((xs[..., None] - others) / (nodes[k] - others), axis=-1)
+            result += values[k] * basis
         return result
 
-    def _format_polynomial_expression(self):
-        def poly_mul(p1, p2):
-            result = defaultdict(float)
-            for deg1, coef1 in p1.items():
-                for deg2, coef2 in p2.items():
-                    result[deg1 + deg2] += coef1 * coef2
-            return result
+    def _interpolate_many_fast(self, xs, values):
+        nodes = np.asarray(self.x_vals)
 
-        final_poly = defaultdict(float)
+        diff = (xs[..., None] - nodes) / self.scale
+        exact = diff == 0
+        safe_diff = np.where(exact, 1.0, diff)
+        node_poly = np.prod(safe_diff, axis=-1)
+        result = node_poly * ((values / np.asarray(self.denominators)) / safe_diff).sum(axis=-1)
 
-        for k in range(self.n):
-            term_poly = {0: 1.0}
-            denom = 1.0
-            for i in range(self.n):
-                if i != k:
-                    term_poly = poly_mul(term_poly, {1: 1.0, 0: -self.x_vals[i]})
-                    denom *= self.x_vals[k] - self.x_vals[i]
-            for deg in term_poly:
-                term_poly[deg] *= self.y_vals[k] / denom
-            for deg in term_poly:
-                final_poly[deg] += term_poly[deg]
-
-        x = symbols("x")
-        poly_expr = sum(coef * x**deg for deg, coef in sorted(final_poly.items()))
-        poly_expr = expand(poly_expr)
-
-        def to_unicode_poly_string(expr):
-            poly = Poly(expr, x)
-            coeffs = poly.all_coeffs()
-            deg = len(coeffs) - 1
-
-            terms = []
-            for i, coeff in enumerate(coeffs):
-                power = deg - i
-                if coeff == 0:
-                    continue
-                sign = "-" if coeff < 0 else "+"
-                abs_coeff = abs(coeff)
-                coeff_str = f"{abs_coeff:.4f}".rstrip("0").rstrip(".") if abs_coeff != 1 or power == 0 else ""
-
-                if power == 0:
-                    term = f"{coeff_str}"
-                elif power == 1:
-                    term = f"{coeff_str}x" if coeff_str else "x"
-                else:
-                    term = f"{coeff_str}x{to_digit_superscript(power)}" if coeff_str else f"x{to_digit_superscript(power)}"
-
-                terms.append((sign, term))
-
-            if not terms:
-                return "0"
-
-            result = terms[0][1] if terms[0][0] == "+" else f"-{terms[0][1]}"
-            for sign, term in terms[1:]:
-                result += f" {sign} {term}"
-
-            return result
-
-        return f"L(x) = {to_unicode_poly_string(poly_expr)}"
-
-    def get_numerical_stability(self, perturbation=1e-5, num_samples=1000):
-        perturbed_y_vals = [y + perturbation for y in self.y_vals]
-        perturbed_interpolator = LagrangeInterpolator(self.x_vals, perturbed_y_vals)
-
-        min_x = min(self.x_vals)
-        max_x = max(self.x_vals)
-        if self.n == 1:
-            return 0.0
+        return np.where(exact.any(axis=-1), values[exact.argmax(axis=-1)], result)
+
+    def _interpolate_many_values(self, xs, values):
+        if self.mode == "reference":
+            return self._interpolate_many_reference(xs, values)
+        return self._interpolate_many_fast(xs, values)
 
-        max_relative_error = 0.0
-        for i in range(num_samples):
-            x_sample = min_x + i * (max_x - min_x) / (num_samples - 1)
-            orig_val = self.interpolate(x_sample)
-            perturbed_val = perturbed_interpolator.interpolate(x_sample)
+    def interpolate_many(self, xs):
+        with profiler.span("evaluate"):
+            return self._interpolate_many_values(np.asarray(xs, dtype=float), np.asarray(self.y_vals))
 
-            if orig_val != 0:
-                rel_error = abs((perturbed_val - orig_val) / orig_val)
-            else:
-                rel_error = abs(perturbed_val - orig_val)
+    def _compute_polynomial_coefficients(self, exact=False):
+        if exact:
+            return exact_monomial_coefficients(self.x_vals, self.y_vals)
+        # denominators are divided by scale once per factor, so the true weights are 1 / (dₖ · scaleⁿ⁻¹).
+        weights = 1.0 / (np.asarray(self.denominators) * self.scale ** (self.n - 1))
+        return barycentric_to_monomial(self.x_vals, weights, self.y_vals)
 
-            max_relative_error = max(max_relative_error, rel_error)
+    def _format_polynomial_expression(self, coefficients):
+        return f"L(x) = {to_unicode_poly_string(coefficients)}"
+
+    def get_numerical_stability(self, perturbation=1e-5, num_samples=1000, x_samples=None, y_samples=None):
+        if self.n == 1:
+            return 0.0
 
-        return max_relative_error
+        with profiler.span("stability"):
+            if x_samples is None or y_samples is None:
+                x_samples = np.linspace(min(self.x_vals), max(self.x_vals), num_samples)
+                y_samples = self._interpolate_many_values(x_samples, np.asarray(self.y_vals))
 
-    def get_polynomial_expression(self):
-        start_time = time.perf_counter()
-        polynomial_expression = self._format_polynomial_expression()
-        end_time = time.perf_counter()
-        self.construction_time = end_time - start_time
-        
-        return polynomial_expression
+            shift_samples = perturbation * self._interpolate_many_values(np.asarray(x_samples, dtype=float), np.ones(self.n))
+            return max_relative_error(y_samples, shift_samples)
 
-    def get_interpolation_time(self):
-        return self.construction_time + self.interpolation_eval_time
+    def get_polynomial_expression(self, exact=False):
+        with profiler.span("coefficients"):
+            coefficients = self._compute_polynomial_coefficients(exact)
+            return self._format_polynomial_expression(coefficients)
 
-    def get_evaluation_only_time(self):
-        return self.interpolation_eval_time
+    def get_memory_usage(self):
+        return memory_usage_kb(self)
@@ -0,0 +1,61 @@
+import sys, tracemalloc
+import numpy as np
+
+def deep_getsizeof(obj, seen_ids=None):
+    """
+    Recursive size in bytes of obj and everything it references, counting
+    each object once. A NumPy array that owns its data reports header plus
+    nbytes through sys.getsizeof; a view reports only its header, so its
+    base array is counted instead (once, however many views share it).
+    """
+    if seen_ids is None:
+        seen_ids = set()
+    if id(obj) in seen_ids:
+        return 0
+    seen_ids.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        size = sys.getsizeof(obj)
+        if obj.base is not None:
+            size += deep_getsizeof(obj.base, seen_ids)
+        return size
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_getsizeof(k, seen_ids) + deep_getsizeof(v, seen_ids) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_getsizeof(i, seen_ids) for i in obj)
+
+    return size
+
+def memory_usage_kb(interpolator):
+    """
+    Resident size of an interpolator's state in KB: everything in its
+    __dict__ except the lazily filled caches named in CACHE_ATTRIBUTES, so
+    the figure does not depend on which getters have already run.
+    """
+    skipped = getattr(interpolator, "CACHE_ATTRIBUTES", ())
+    state = {name: value for name, value in vars(interpolator).items() if name not in skipped}
+    return round(deep_getsizeof(state) / 1024, 2)
+
+def measure_peak_memory(func, *args, **kwargs):
+    """
+    Runs func under tracemalloc and returns (result, peak_kb), the peak of
+    Python-level allocations made during the call. Costly; meant for
+    occasional measurements rather than every calculate.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return result, round((peak - baseline) / 1024, 2)
@@ -1,123 +1,104 @@
-import time
-from sympy import symbols, expand, Poly
-from utils.string_manipulation import to_digit_superscript
+import numpy as np
+from algorithms.coefficients import newton_to_monomial, exact_monomial_coefficients
+from algorithms.stability import max_relative_error
+from algorithms.memory import memory_usage_kb
+from utils.profiling import profiler
+from utils.string_manipulation import to_unicode_poly_string
 
 class NewtonInterpolator:
     def __init__(self, x_vals, y_vals):
-        self.x_vals = [float(x) for x in x_vals]
-        self.y_vals = [float(y) for y in y_vals]
-        self.divided_diffs = self._compute_divided_differences()
-        self.interpolation_eval_time = 0
-
-    def _compute_divided_differences(self):
-        n = len(self.x_vals)
-        table = [[0.0 for _ in range(n)] for _ in range(n)]
-
-        for i in range(n):
-            table[i][0] = self.y_vals[i]
-
-        for j in range(1, n):
-            for i in range(n - j):
-                numerator = table[i + 1][j - 1] - table[i][j - 1]
-                denominator = self.x_vals[i + j] - self.x_vals[i]
-                table[i][j] = numerator / denominator
+        with profiler.span("construct"):
+            self.x_vals = [float(x) for x in x_vals]
+            self.y_vals = [float(y) for y in y_vals]
+            self.divided_diffs = self._compute_divided_differences()
+
+    def _compute_divided_differences(self, values=None):
+        with profiler.span("weights"):
+            nodes = np.asarray(self.x_vals)
+            coeffs = np.array(self.y_vals if values is None else values, dtype=float)
+
+            for j in range(1, len(coeffs)):
+                coeffs[j:] = (coeffs[j:] - coeffs[j - 1:-1]) / (nodes[j:] - nodes[:-j])
+
+            return coeffs
+
+    def add_point(self, x, y):
+        with profiler.span("weights"):
+            x = float(x)
+            node_poly = 1.0
+            for xk in self.x_vals:
+                node_poly *= x - xk
+            if node_poly == 0:
+                raise ZeroDivisionError("Duplicate x-values encountered.")
+
+            coeff = (float(y) - self._evaluate_nested(x)) / node_poly if self.x_vals else float(y)
+            self.divided_diffs = np.append(self.divided_diffs, coeff)
+            self.x_vals.append(x)
+            self.y_vals.append(float(y))
+
+    def remove_point(self, i):
+        with profiler.span("weights"):
+            coeffs = self.divided_diffs
+            for k in range(i, len(self.x_vals) - 1):
+                coeffs[k] += (self.x_vals[k + 1] - self.x_vals[k]) * coeffs[k + 1]
+                self.x_vals[k], self.x_vals[k + 1] = self.x_vals[k + 1], self.x_vals[k]
+                self.y_vals[k], self.y_vals[k + 1] = self.y_vals[k + 1], self.y_vals[k]
+
+            self.divided_diffs = coeffs[:-1].copy()
+            self.x_vals.pop()
+            self.y_vals.pop()
+
+    def update_y(self, i, y):
+        with profiler.span("weights"):
+            delta = float(y) - self.y_vals[i]
+            diffs = self.x_vals[i] - np.asarray(self.x_vals)
+            diffs[i] = 1.0
+
+            self.divided_diffs[i:] += delta / np.cumprod(diffs)[i:]
+            self.y_vals[i] = float(y)
+
+    def _evaluate_nested(self, x, coeffs=None):
+        coeffs = self.divided_diffs if coeffs is None else coeffs
+        result = x * 0.0 + coeffs[-1]
+        for i in range(len(coeffs) - 2, -1, -1):
+            result = result * (x - self.x_vals[i]) + coeffs[i]
+        return result
 
-        return [table[0][j] for j in range(n)]
+    def _interpolate_many_values(self, xs, values):
+        return self._evaluate_nested(xs, self._compute_divided_differences(values))
 
     def interpolate(self, x):
-        start = time.perf_counter()
+        with profiler.span("evaluate"):
+            return float(self._evaluate_nested(float(x)))
 
-        result = self.divided_diffs[0]
-        term = 1.0
-        for i in range(1, len(self.divided_diffs)):
-            term *= (x - self.x_vals[i - 1])
-            result += self.divided_diffs[i] * term
+    def interpolate_many(self, xs):
+        with profiler.span("evaluate"):
+            return self._evaluate_nested(np.asarray(xs, dtype=float))
 
-        end = time.perf_counter()
-        self.interpolation_eval_time += end - start
+    def _compute_polynomial_coefficients(self, exact=False):
+        if exact:
+            return exact_monomial_coefficients(self.x_vals, self.y_vals)
+        return newton_to_monomial(self.divided_diffs, self.x_vals)
 
-        return result
+    def _format_polynomial_expression(self, coefficients):
+        return f"N(x) = {to_unicode_poly_string(coefficients)}"
 
-    def _format_polynomial_expression(self):
-        x = symbols('x')
-        n = len(self.divided_diffs)
-        polynomial = 0
-        term = 1
-
-        for i in range(n):
-            coeff = self.divided_diffs[i]
-            polynomial += coeff * term
-            if i < n - 1:
-                term *= (x - self.x_vals[i])
-
-        polynomial = expand(polynomial)
-
-        def to_unicode_poly_string(poly_expr):
-            poly = Poly(poly_expr, x)
-            coeffs = poly.all_coeffs()
-            degree = len(coeffs) - 1
-
-            terms = []
-            for i, coeff in enumerate(coeffs):
-                power = degree - i
-                if coeff == 0:
-                    continue
-                sign = "-" if coeff < 0 else "+"
-                abs_coeff = abs(coeff)
-                coeff_str = f"{abs_coeff:.4f}".rstrip("0").rstrip(".") if abs_coeff != 1 or power == 0 else ""
-
-                if power == 0:
-                    term = f"{coeff_str}"
-                elif power == 1:
-                    term = f"{coeff_str}x" if coeff_str else "x"
-                else:
-                    term = f"{coeff_str}x{to_digit_superscript(power)}" if coeff_str else f"x{to_digit_superscript(power)}"
-
-                terms.append((sign, term))
-
-            if not terms:
-                return "0"
-            result = terms[0][1] if terms[0][0] == "+" else f"-{terms[0][1]}"
-            for sign, term in terms[1:]:
-                result += f" {sign} {term}"
-            return result
-
-        return f"N(x) = {to_unicode_poly_string(polynomial)}"
-
-    def get_numerical_stability(self, perturbation=1e-5, num_samples=1000):
-        perturbed_y_vals = [y + perturbation for y in self.y_vals]
-        perturbed_interpolator = NewtonInterpolator(self.x_vals, perturbed_y_vals)
-
-        min_x = min(self.x_vals)
-        max_x = max(self.x_vals)
+    def get_numerical_stability(self, perturbation=1e-5, num_samples=1000, x_samples=None, y_samples=None):
         if len(self.x_vals) == 1:
             return 0.0
 
-        max_relative_error = 0.0
-        for i in range(num_samples):
-            x_sample = min_x + i * (max_x - min_x) / (num_samples - 1)
-            orig_val = self.interpolate(x_sample)
-            perturbed_val = perturbed_interpolator.interpolate(x_sample)
-
-            if orig_val != 0:
-                rel_error = abs((perturbed_val - orig_val) / orig_val)
-            else:
-                rel_error = abs(perturbed_val - orig_val)
-
-            max_relative_error = max(max_relative_error, rel_error)
-
-        return max_relative_error
+        with profiler.span("stability"):
+            if x_samples is None or y_samples is None:
+                x_samples = np.linspace(min(self.x_vals), max(self.x_vals), num_samples)
+                y_samples = self._interpolate_many_values(x_samples, np.asarray(self.y_vals))
 
-    def get_polynomial_expression(self):
-        start_time = time.perf_counter()
-        polynomial_expression = self._format_polynomial_expression()
-        end_time = time.perf_counter()
-        self.construction_time = end_time - start_time
-        
-        return polynomial_expression
+            shift_samples = perturbation * self._interpolate_many_values(np.asarray(x_samples, dtype=float), np.ones(len(self.x_vals)))
+            return max_relative_error(y_samples, shift_samples)
 
-    def get_interpolation_time(self):
-        return self.construction_time + self.interpolation_eval_time
+    def get_polynomial_expression(self, exact=False):
+        with profiler.span("coefficients"):
+            coefficients = self._compute_polynomial_coefficients(exact)
+            return self._format_polynomial_expression(coefficients)
 
-    def get_evaluation_only_time(self):
-        return self.interpolation_eval_time
+    def get_memory_usage(self):
+        return memory_usage_kb(self)
@@ -0,0 +1,9 @@
+import numpy as np
+
+def max_relative_error(orig_vals, error_vals):
+    orig_vals = np.asarray(orig_vals, dtype=float)
+    abs_error = np.abs(np.asarray(error_vals, dtype=float))
+    nonzero = orig_vals != 0
+
+    relative = np.where(nonzero, abs_error / np.where(nonzero, np.abs(orig_vals), 1.0), abs_error)
+    return float(relative.max()) if relative.size else 0.0
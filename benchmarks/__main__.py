@@ -0,0 +1,64 @@
+import argparse, sys
+
+from utils.timing import DISTRIBUTIONS
+from benchmarks.suite import ALGORITHMS, SIZES, GRIDS, run_suite, metadata, save_json, load_json, save_csv, compare_results
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+def print_result(result):
+    print(
+        f"{result['algorithm']:<12}{result['distribution']:<11}{result['n']:>6}{result['grid']:>7}"
+        f"{format_seconds(result['construct_s']):>12}{format_seconds(result['evaluate_s']):>12}"
+        f"{result['evaluate_ns_per_point']:>14.0f}"
+    )
+
+def print_comparison(rows, threshold):
+    print(f"\nComparison against baseline (regression threshold x{threshold:g})")
+    print(f"{'algorithm':<12}{'dist':<11}{'n':>6}{'grid':>7}{'construct':>12}{'evaluate':>12}")
+    for row in rows:
+        algorithm, distribution, n, grid = row["case"]
+        flag = "  REGRESSION: " + ", ".join(row["regressed"]) if row["regressed"] else ""
+        print(f"{algorithm:<12}{distribution:<11}{n:>6}{grid:>7}{row['construct_s']:>11.2f}x{row['evaluate_s']:>11.2f}x{flag}")
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Time interpolator construction and evaluation across node counts, distributions and grid sizes.")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES), help="node counts")
+    parser.add_argument("--grids", nargs="+", type=int, default=list(GRIDS), help="evaluation grid sizes")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case; the minimum is reported")
+    parser.add_argument("--quick", action="store_true", help="small sweep for a fast sanity check")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.quick:
+        args.sizes, args.grids, args.repeat = [10, 100, 500], [1000], 3
+
+    print(f"{'algorithm':<12}{'dist':<11}{'n':>6}{'grid':>7}{'construct':>12}{'evaluate':>12}{'ns/point':>14}")
+    results = run_suite(args.algorithms, args.distributions, args.sizes, args.grids, args.warmup, args.repeat, progress=print_result)
+
+    if args.json:
+        save_json(args.json, results, metadata(args.warmup, args.repeat))
+    if args.csv:
+        save_csv(args.csv, results)
+
+    if args.baseline:
+        rows = compare_results(results, load_json(args.baseline), args.threshold)
+        print_comparison(rows, args.threshold)
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
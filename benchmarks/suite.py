@@ -0,0 +1,97 @@
+import csv, json, platform, time
+import numpy as np
+
+from algorithms.lagrange import LagrangeInterpolator
+from algorithms.newton import NewtonInterpolator
+from algorithms.barycentric import BarycentricInterpolator
+from utils.timing import generate_nodes, sample_values, best_time
+
+ALGORITHMS = {"lagrange": LagrangeInterpolator, "newton": NewtonInterpolator, "barycentric": BarycentricInterpolator}
+SIZES = (10, 50, 100, 500, 1000, 2000)
+GRIDS = (100, 1000)
+FIELDS = ("algorithm", "distribution", "n", "grid", "construct_s", "evaluate_s", "evaluate_ns_per_point")
+
+def run_case(algorithm, distribution, n, grid, warmup=1, repeat=5):
+    interpolator_class = ALGORITHMS[algorithm]
+    x_vals = generate_nodes(distribution, n).tolist()
+    y_vals = sample_values(np.asarray(x_vals)).tolist()
+    xs = np.linspace(-1.0, 1.0, grid)
+
+    # Large n overflows the weights and divided differences; only the timings matter here.
+    with np.errstate(all="ignore"):
+        construct_s = best_time(lambda: interpolator_class(x_vals, y_vals), warmup, repeat)
+        interpolator = interpolator_class(x_vals, y_vals)
+        evaluate_s = best_time(lambda: interpolator.interpolate_many(xs), warmup, repeat)
+
+    return {
+        "algorithm": algorithm,
+        "distribution": distribution,
+        "n": n,
+        "grid": grid,
+        "construct_s": construct_s,
+        "evaluate_s": evaluate_s,
+        "evaluate_ns_per_point": evaluate_s / grid * 1e9,
+    }
+
+def run_suite(algorithms, distributions, sizes, grids, warmup=1, repeat=5, progress=None):
+    results = []
+    for algorithm in algorithms:
+        for distribution in distributions:
+            for n in sizes:
+                for grid in grids:
+                    result = run_case(algorithm, distribution, n, grid, warmup, repeat)
+                    results.append(result)
+                    if progress:
+                        progress(result)
+    return results
+
+def metadata(warmup, repeat):
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+def save_json(path, results, meta):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+def save_csv(path, results):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+def compare_results(results, baseline, threshold=1.25, min_seconds=50e-6):
+    """
+    Matches results to baseline cases by (algorithm, distribution, n, grid).
+    Returns one row per matched case with the current/baseline ratios; a
+    row is a regression when a ratio exceeds `threshold` and the current
+    time is above `min_seconds`, below which timer noise dominates.
+    """
+    def key(result):
+        return (result["algorithm"], result["distribution"], result["n"], result["grid"])
+
+    baseline_by_key = {key(result): result for result in baseline}
+    rows = []
+    for result in results:
+        previous = baseline_by_key.get(key(result))
+        if previous is None:
+            continue
+
+        row = {"case": key(result), "regressed": []}
+        for metric in ("construct_s", "evaluate_s"):
+            ratio = result[metric] / previous[metric] if previous[metric] > 0 else float("inf")
+            row[metric] = ratio
+            if ratio > threshold and result[metric] > min_seconds:
+                row["regressed"].append(metric)
+        rows.append(row)
+    return rows
@@ -1,10 +1,12 @@
+import sys, atexit, threading
 import flet as ft
 from views.home_page import HomePage
-from views.compare_page import build_compare_page
-from views.graph_page import build_graph_page
 
-from utils.server import run_server_in_background
-run_server_in_background()
+def warm_up_plotting():
+    import views.compare_page
+    import views.graph_page
+    from utils.dynamic_cartesian_plot import plotly_bundle_url
+    plotly_bundle_url()
 
 def main(page: ft.Page):
     page.title = "PlotNomial"
@@ -16,12 +18,34 @@ def main(page: ft.Page):
         if page.route == "/":
             page.views.append(ft.View("/", [HomePage(page)]))
         elif page.route == "/compare":
+            from views.compare_page import build_compare_page
             page.views.append(ft.View("/compare", [build_compare_page(page)]))
         elif page.route == "/graph":
+            from views.graph_page import build_graph_page
             page.views.append(ft.View("/compare", [build_graph_page(page)]))
         page.update()
 
     page.on_route_change = route_change
     page.go("/")
 
-ft.app(target=main, view=ft.AppView.WEB_BROWSER)
+    threading.Thread(target=warm_up_plotting, daemon=True).start()
+
+if __name__ == "__main__":
+    if "--import-profile" in sys.argv:
+        from utils.import_profile import print_import_profile
+        print_import_profile()
+        sys.exit(0)
+
+    if "--trace-memory" in sys.argv:
+        from views.graph_output_panel import GraphOutputPanel
+        GraphOutputPanel.TRACE_PEAK_MEMORY = True
+
+    if "--profile" in sys.argv:
+        from utils.profiling import profiler, enable_profiling
+        enable_profiling()
+        atexit.register(lambda: print(profiler.report()))
+
+    from utils.server import run_server_in_background
+    run_server_in_background()
+
+    ft.app(target=main, view=ft.AppView.WEB_BROWSER)
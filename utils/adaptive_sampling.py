@@ -0,0 +1,43 @@
+import numpy as np
+
+def adaptive_sample(evaluate_many, x_min, x_max, degree=None, tolerance=5e-4, max_points=1000, max_depth=12):
+    """
+    Samples a curve by repeated subdivision, splitting only the intervals
+    whose midpoint deviates from the chord by more than `tolerance` times
+    the curve's vertical extent. Each level is evaluated as one batch.
+
+    evaluate_many: vectorized f(xs) -> ys, e.g. an interpolator's `interpolate_many`
+    degree: (optional) polynomial degree, used to size the initial grid so every wiggle is seen
+    max_points: hard budget on the number of returned samples
+    """
+    if x_min == x_max:
+        xs = np.array([float(x_min)])
+        return xs, evaluate_many(xs)
+
+    initial_points = 17 if degree is None else 4 * degree + 1
+    initial_points = int(min(max(initial_points, 9), max_points))
+
+    xs = np.linspace(x_min, x_max, initial_points)
+    ys = evaluate_many(xs)
+    y_extent = np.ptp(ys[np.isfinite(ys)]) if np.isfinite(ys).any() else 0.0
+    abs_tolerance = tolerance * (y_extent if y_extent > 0 else 1.0)
+
+    for _ in range(max_depth):
+        budget = max_points - len(xs)
+        if budget <= 0:
+            break
+
+        mid_xs = (xs[:-1] + xs[1:]) / 2
+        mid_ys = evaluate_many(mid_xs)
+        errors = np.abs(mid_ys - (ys[:-1] + ys[1:]) / 2)
+
+        refine = np.flatnonzero(errors > abs_tolerance)
+        if refine.size == 0:
+            break
+        if refine.size > budget:
+            refine = np.sort(refine[np.argsort(errors[refine])[-budget:]])
+
+        xs = np.insert(xs, refine + 1, mid_xs[refine])
+        ys = np.insert(ys, refine + 1, mid_ys[refine])
+
+    return xs, ys
@@ -0,0 +1,177 @@
+import os, time, gzip, hashlib, tempfile, threading
+from collections import OrderedDict
+from utils.profiling import profiler
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STALE_TEMP_SECONDS = 60
+CONTENT_TYPES = {".html": "text/html; charset=utf-8", ".json": "application/json", ".js": "text/javascript; charset=utf-8"}
+
+class ArtifactStore:
+    """
+    Content-addressed store for generated pages.
+
+    Every artifact is named by the SHA-256 of its content and written once,
+    atomically, to `directory` as <hash><ext>. A hot copy is kept in memory
+    up to `max_memory_bytes`, and the files on disk are pruned least
+    recently used first once they exceed `max_disk_bytes`; the disk is
+    only scanned after `max_disk_bytes / 16` of new files have been
+    written. The latest artifact published under each name
+    (e.g. "graph.html") is pinned and never evicted.
+    """
+    def __init__(self, directory, max_memory_bytes=64 * 1024 * 1024, max_disk_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        self._by_hash = OrderedDict()
+        self._names = {}
+        self._memory_bytes = 0
+        self._written_since_prune = 0
+
+    def publish(self, name, content, content_type=None):
+        body = content.encode("utf-8") if isinstance(content, str) else content
+        ext = os.path.splitext(name)[1] or ".bin"
+        content_hash = hashlib.sha256(body).hexdigest()
+        filename = content_hash + ext
+
+        with profiler.span("write"):
+            written = self._write_file(filename, body)
+            with self._lock:
+                self._remember(filename, body, content_type or CONTENT_TYPES.get(ext, "application/octet-stream"))
+                self._names[name] = filename
+                self._evict_memory()
+                if written:
+                    self._written_since_prune += len(body)
+                prune = self._written_since_prune > self.max_disk_bytes // 16
+            if prune:
+                self.prune_disk()
+
+        return filename
+
+    def get(self, filename=None, name=None):
+        """Returns (filename, artifact) or (None, None), loading from disk on a memory miss."""
+        with self._lock:
+            if filename is None:
+                filename = self._names.get(name)
+            if filename is None:
+                return None, None
+            artifact = self._by_hash.get(filename)
+            if artifact is not None:
+                self._by_hash.move_to_end(filename)
+
+        path = self._path(filename)
+        if artifact is not None:
+            # Keep the file's mtime current so disk pruning evicts by last use, not publish time.
+            self._touch(path)
+            return filename, artifact
+
+        if path is None:
+            return None, None
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+        except (FileNotFoundError, IsADirectoryError):
+            return None, None
+        self._touch(path)
+
+        with self._lock:
+            artifact = self._remember(filename, body, CONTENT_TYPES.get(os.path.splitext(filename)[1], "application/octet-stream"))
+            self._evict_memory()
+        return filename, artifact
+
+    def encoded_body(self, artifact, encoding):
+        if encoding not in artifact["encoded"]:
+            if encoding == "br":
+                artifact["encoded"][encoding] = brotli.compress(artifact["body"])
+            else:
+                artifact["encoded"][encoding] = gzip.compress(artifact["body"], compresslevel=6)
+        return artifact["encoded"][encoding]
+
+    def prune_disk(self):
+        """Deletes abandoned temp files, then the least recently used artifacts beyond `max_disk_bytes`."""
+        if not os.path.isdir(self.directory):
+            return
+
+        with self._lock:
+            pinned = set(self._names.values())
+            self._written_since_prune = 0
+
+        files = []
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            if entry.name.endswith(".tmp"):
+                try:
+                    if time.time() - entry.stat().st_mtime > STALE_TEMP_SECONDS:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+                continue
+            if self._path(entry.name) is not None:
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry))
+
+        total_bytes = sum(size for _, size, _ in files)
+        for _, size, entry in sorted(files, key=lambda item: item[0]):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            if entry.name in pinned:
+                continue
+            try:
+                os.remove(entry.path)
+                total_bytes -= size
+            except OSError:
+                pass
+
+    def _path(self, filename):
+        content_hash, ext = os.path.splitext(filename)
+        if len(content_hash) != 64 or not ext or any(c not in "0123456789abcdef" for c in content_hash):
+            return None
+        return os.path.join(self.directory, filename)
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _write_file(self, filename, body):
+        """Writes body unless the file already exists; returns whether it was written."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, filename)
+        if os.path.exists(path):
+            self._touch(path)
+            return False
+
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(body)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return True
+
+    def _remember(self, filename, body, content_type):
+        artifact = self._by_hash.get(filename)
+        if artifact is None:
+            artifact = {"body": body, "content_type": content_type, "encoded": {}}
+            self._by_hash[filename] = artifact
+            self._memory_bytes += len(body)
+        self._by_hash.move_to_end(filename)
+        return artifact
+
+    def _evict_memory(self):
+        pinned = set(self._names.values())
+        for filename in list(self._by_hash):
+            if self._memory_bytes <= self.max_memory_bytes:
+                break
+            if filename in pinned:
+                continue
+            self._memory_bytes -= len(self._by_hash.pop(filename)["body"])
@@ -0,0 +1,25 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from utils.figure_renderer import render_interpolation
+from utils.profiling import profiler
+
+_executor = None
+
+def get_compare_executor():
+    global _executor
+    if _executor is None:
+        # Spawned, not forked: the app already runs server and warm-up threads whose locks a fork would copy held.
+        _executor = ProcessPoolExecutor(max_workers=3, mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+def compute_interpolation(x_vals, y_vals, poly):
+    """
+    Runs in a worker process. Returns (poly, time_taken, encoded_image,
+    numerical_stability, spans); spans holds the worker's span totals so
+    the caller can record them in its own profiler.
+    """
+    with profiler.collect() as spans:
+        encoded_image, x_range, y_range = render_interpolation(x_vals, y_vals, poly)
+        time_taken = spans.get("evaluate", 0.0)
+        numerical_stability = poly.get_numerical_stability(x_samples=x_range, y_samples=y_range)
+    return poly, time_taken, encoded_image, numerical_stability, spans
@@ -1,7 +1,25 @@
-import plotly, json
+import plotly, json, base64
 import plotly.graph_objs as go
-from plotly.offline import plot
+from plotly.offline import plot, get_plotlyjs, get_plotlyjs_version
 import numpy as np
+from utils.adaptive_sampling import adaptive_sample
+from utils.server import publish_artifact
+from utils.profiling import profiler
+
+MAX_ANIMATED_POINTS = 20000
+
+_plotly_bundle_url = None
+
+def plotly_bundle_url():
+    """
+    URL of the Plotly.js bundle shipped with the plotly package, published
+    once to the local artifact server so pages load it offline and from
+    the browser cache after the first time.
+    """
+    global _plotly_bundle_url
+    if _plotly_bundle_url is None:
+        _plotly_bundle_url = publish_artifact(f"plotly-{get_plotlyjs_version()}.min.js", get_plotlyjs())
+    return _plotly_bundle_url
 
 def generate_eval_history_plot(eval_times):
     if not eval_times or len(eval_times) < 1:
@@ -52,7 +70,7 @@ def generate_eval_history_plot(eval_times):
     )
 
     fig = go.Figure(data=[trace], layout=layout)
-    return plot(fig, output_type="div", include_plotlyjs="cdn", config={"displayModeBar": False})
+    return plot(fig, output_type="div", include_plotlyjs=plotly_bundle_url(), config={"displayModeBar": False})
 
 def generate_interpolation_trace(x_range, y_range, name="Interpolation", color="#0000FF"):
     return go.Scatter(x=x_range, y=y_range, mode="lines", name=name, line=dict(color=color, width=2))
@@ -113,14 +131,44 @@ def create_layout(x_vals, y_vals):
         showlegend=False
     )
 
-def generate_plot_html(fig):
-    fig_json = json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+def encode_float64(values):
+    return base64.b64encode(np.asarray(values, dtype="<f8").tobytes()).decode("ascii")
+
+def split_line_data(fig):
+    """
+    Returns the figure as a plain dict with the x/y of every line trace
+    emptied, plus those arrays as base64 little-endian float64 strings
+    that the page decodes straight into Float64Arrays.
+    """
+    fig_dict = {"data": [], "layout": fig.layout.to_plotly_json()}
+    line_data = []
+    for trace in fig.data:
+        trace_dict = trace.to_plotly_json()
+        if trace.mode == "lines":
+            line_data.append({"x": encode_float64(trace.x), "y": encode_float64(trace.y)})
+            trace_dict["x"], trace_dict["y"] = [], []
+        fig_dict["data"].append(trace_dict)
+    return fig_dict, line_data
+
+def generate_plot_html(fig, graph_id=None, animate=None):
+    """
+    animate: reveal the lines and launch the fireworks on load; by default
+    only when the lines hold at most MAX_ANIMATED_POINTS samples in total
+    """
+    if animate is None:
+        animate = sum(len(trace.x) for trace in fig.data if trace.mode == "lines") <= MAX_ANIMATED_POINTS
+    fig_dict, line_data = split_line_data(fig)
+    fig_json = json.dumps(fig_dict, cls=plotly.utils.PlotlyJSONEncoder)
+    line_data_json = json.dumps(line_data)
+    graph_id_json = json.dumps(graph_id)
+    animate_json = json.dumps(animate)
+    plotly_url = plotly_bundle_url()
     return f"""
     <html>
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+        <script src="{plotly_url}"></script>
         <style>
             html, body {{
                 margin: 0;
@@ -139,54 +187,76 @@ def generate_plot_html(fig):
         <div id="graph"></div>
         <script>
             const fig = {fig_json};
-            const fullData = JSON.parse(JSON.stringify(fig.data));
-            fig.data.forEach(trace => {{
-                if (trace.mode === "lines") {{
-                    trace.x = [];
-                    trace.y = [];
-                }}
-            }});
+            const lineData = {line_data_json}.map(line => ({{ x: decodeFloat64(line.x), y: decodeFloat64(line.y) }}));
+
+            function decodeFloat64(encoded) {{
+                const binary = atob(encoded);
+                const bytes = new Uint8Array(binary.length);
+                for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+                return new Float64Array(bytes.buffer);
+            }}
             const config = {{
                 scrollZoom: true,
                 displayModeBar: false,
                 displaylogo: false
             }};
-            Plotly.newPlot("graph", fig.data, fig.layout, config).then(() => {{
-                animateLines();
-            }});
-            function animateLines() {{
-                const steps = 25;
-                const delay = 5;  // ms between steps
-
-                let frames = [];
-
-                fullData.forEach((trace, traceIndex) => {{
-                    if (trace.mode !== "lines") return;
-
-                    const len = trace.x.length;
-                    for (let i = 1; i <= steps; i++) {{
-                        const cutoff = Math.floor((i / steps) * len);
-                        frames.push({{
-                            traceIndex,
-                            x: trace.x.slice(0, cutoff),
-                            y: trace.y.slice(0, cutoff)
-                        }});
-                    }}
+            const graphId = {graph_id_json};
+            const animate = {animate_json};
+            const lineTraceIndices = fig.data.map((trace, index) => trace.mode === "lines" ? index : -1).filter(index => index >= 0);
+            let animationCancelled = false;
+            let resampleTimer = null;
+            let resampleSeq = 0;
+            const revealDuration = 600;  // ms
+            let revealStart = null;
+
+            if (!animate) {{
+                lineTraceIndices.forEach((traceIndex, lineIndex) => {{
+                    fig.data[traceIndex].x = lineData[lineIndex].x;
+                    fig.data[traceIndex].y = lineData[lineIndex].y;
                 }});
+            }}
 
-                let i = 0;
-                function step() {{
-                    if (i >= frames.length) return;
-                    const f = frames[i];
-                    Plotly.restyle("graph", {{
-                        x: [f.x],
-                        y: [f.y]
-                    }}, [f.traceIndex]);
-                    i++;
-                    setTimeout(step, delay);
-                }}
+            Plotly.newPlot("graph", fig.data, fig.layout, config).then(gd => {{
+                gd.on("plotly_relayout", requestViewportSamples);
+                if (animate) requestAnimationFrame(revealLines);
+            }});
+
+            // Re-sample the curves for the visible x-range from the local server.
+            function requestViewportSamples() {{
+                if (!graphId) return;
+                animationCancelled = true;
+                clearTimeout(resampleTimer);
+                resampleTimer = setTimeout(() => {{
+                    const gd = document.getElementById("graph");
+                    const [x0, x1] = gd.layout.xaxis.range;
+                    const n = Math.round(gd.clientWidth * 2);
+                    const seq = ++resampleSeq;
+
+                    fetch(`/resample?graph=${{graphId}}&x0=${{x0}}&x1=${{x1}}&n=${{n}}`)
+                        .then(response => response.ok ? response.json() : null)
+                        .then(payload => {{
+                            if (!payload || seq !== resampleSeq) return;
+                            Plotly.restyle("graph", {{
+                                x: payload.curves.map(curve => curve.x),
+                                y: payload.curves.map(curve => curve.y)
+                            }}, lineTraceIndices);
+                        }})
+                        .catch(() => {{}});
+                }}, 150);
+            }}
+
+            // Reveal all lines together, one batched restyle per display frame.
+            function revealLines(now) {{
+                if (animationCancelled) return;
+                if (revealStart === null) revealStart = now;
+                const progress = Math.min((now - revealStart) / revealDuration, 1);
+
+                Plotly.restyle("graph", {{
+                    x: lineData.map(line => line.x.subarray(0, Math.ceil(progress * line.x.length))),
+                    y: lineData.map(line => line.y.subarray(0, Math.ceil(progress * line.y.length)))
+                }}, lineTraceIndices);
 
-                step();
+                if (progress < 1) requestAnimationFrame(revealLines);
             }}
         </script>
         <canvas id="fireworks-canvas" style="position:absolute;top:0;left:0;pointer-events:none;width:100%;height:100%;z-index:999;"></canvas>
@@ -228,7 +298,7 @@ def generate_plot_html(fig):
                     p.y += p.vy;
                     p.alpha -= 0.02;
                 }}
-                requestAnimationFrame(draw);
+                if (particles.length > 0) requestAnimationFrame(draw);
             }}
 
             function launchFireworks() {{
@@ -247,23 +317,55 @@ def generate_plot_html(fig):
                 }}
             }}
 
-            setTimeout(() => {{
-                launchFireworks();
-                draw();
-            }}, 20);
+            if (animate) {{
+                setTimeout(() => {{
+                    launchFireworks();
+                    requestAnimationFrame(draw);
+                }}, 20);
+            }}
         </script>
     </body>
     </html>
     """
 
-def generate_multi_interpolation_plot(data_sets):
+def compute_line_result(interpolator, x_vals, num_samples=1000):
+    with profiler.collect() as spans:
+        x_range, y_range = adaptive_sample(interpolator.interpolate_many, min(x_vals), max(x_vals), degree=len(x_vals) - 1, max_points=num_samples)
+
+    result = {
+        "x_range": x_range.tolist(),
+        "y_range": y_range.tolist(),
+        "memory_usage": interpolator.get_memory_usage(),
+        "eval_time": spans.get("evaluate", 0.0),
+        "stability": None,
+    }
+
+    try:
+        result["stability"] = interpolator.get_numerical_stability(x_samples=x_range, y_samples=y_range)
+    except Exception as e:
+        print(f"Error retrieving time/stability: {e}")
+
+    return result
+
+def generate_line_traces(data, index=0):
+    label = data.get("label", f"Interpolation {index+1}")
+    color = data.get("color", f"hsl({index * 50}, 70%, 50%)")
+    result = data["result"]
+
+    trace_curve = generate_interpolation_trace(result["x_range"], result["y_range"], name=label, color=color)
+    trace_points = generate_data_points_trace(data["x_vals"], data["y_vals"])
+    return [trace_curve, trace_points]
+
+def generate_multi_interpolation_plot(data_sets, graph_id=None):
     """
     data_sets: list of dicts with keys:
         - x_vals: list of x data
         - y_vals: list of y data
-        - interpolator: object with `.interpolate(x)` method
+        - result: dict from `compute_line_result`
+        - traces: (optional) traces from `generate_line_traces` to reuse
         - label: (optional) curve name
         - color: (optional) line color
+    graph_id: (optional) id registered with the server for viewport re-sampling
     """
     all_traces = []
     all_x_vals, all_y_vals = [], []
@@ -274,30 +376,21 @@ def generate_multi_interpolation_plot(data_sets):
     for i, data in enumerate(data_sets):
         x_vals = [float(x) for x in data["x_vals"]]
         y_vals = [float(y) for y in data["y_vals"]]
-        interpolator = data["interpolator"]
-        label = data.get("label", f"Interpolation {i+1}")
-        color = data.get("color", f"hsl({i * 50}, 70%, 50%)")
-
-        x_range = np.linspace(min(x_vals), max(x_vals), 1000).tolist()
-        y_range = [float(interpolator.interpolate(x)) for x in x_range]
+        result = data["result"]
+        traces = data.get("traces") or generate_line_traces(data, i)
 
-        trace_curve = generate_interpolation_trace(x_range, y_range, name=label, color=color)
-        trace_points = generate_data_points_trace(x_vals, y_vals)
-
-        all_traces.extend([trace_curve, trace_points])
+        all_traces.extend(traces)
         all_x_vals.extend(x_vals)
         all_y_vals.extend(y_vals)
-        memory_usage = max(memory_usage, interpolator.get_memory_usage())
-
-        try:
-            total_eval_time += interpolator.get_evaluation_only_time()
-            stability = interpolator.get_numerical_stability()
-            if max_stability is None or stability > max_stability:
-                max_stability = stability
-        except Exception as e:
-            print(f"Error retrieving time/stability: {e}")
-
-
-    layout = create_layout(all_x_vals, all_y_vals)
-    fig = go.Figure(data=all_traces, layout=layout)
-    return generate_plot_html(fig), total_eval_time, max_stability, memory_usage
+        memory_usage += result["memory_usage"]
+
+        total_eval_time += result["eval_time"]
+        stability = result["stability"]
+        if stability is not None and (max_stability is None or stability > max_stability):
+            max_stability = stability
+
+    with profiler.span("render"):
+        layout = create_layout(all_x_vals, all_y_vals)
+        fig = go.Figure(data=all_traces, layout=layout)
+        html = generate_plot_html(fig, graph_id)
+    return html, total_eval_time, max_stability, round(memory_usage, 2)
@@ -0,0 +1,146 @@
+import base64, io, threading
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from utils.adaptive_sampling import adaptive_sample
+from utils.profiling import profiler
+
+class CurveRenderer:
+    """
+    One pre-built figure for the Compare interpolation plots. Rendering only
+    swaps the line and marker data and rescales the axes; the figure keeps
+    fixed margins instead of a tight bounding-box pass.
+    """
+    def __init__(self):
+        self.figure = Figure(figsize=(6.4, 4.8))
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.figure.patch.set_alpha(0)
+        self.figure.subplots_adjust(left=0.1, right=0.97, bottom=0.1, top=0.97)
+
+        self.ax = self.figure.add_subplot()
+        self.ax.patch.set_alpha(0)
+        self.curve, = self.ax.plot([], [], label="Graph", color="#2196F3", linewidth=2.5)
+        self.points, = self.ax.plot([], [], "o", color="#F44336", markersize=10, zorder=5, label="Data Points")
+        self.ax.grid(True)
+        self.ax.set_aspect('equal', adjustable='datalim')
+        self.ax.set_xlabel("X")
+        self.ax.set_ylabel("Y")
+        self.ax.legend()
+
+    def render(self, x_range, y_range, x_vals, y_vals):
+        self.curve.set_data(x_range, y_range)
+        self.points.set_data(x_vals, y_vals)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        return _encode_png(self.canvas)
+
+class BarChartRenderer:
+    """Pre-built bar chart whose bar heights and value labels are updated in place."""
+    def __init__(self, labels, color, ylabel, title):
+        self.figure = Figure(figsize=(4, 3))
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.figure.patch.set_alpha(0)
+        self.figure.subplots_adjust(left=0.2, right=0.96, bottom=0.1, top=0.9)
+
+        self.ax = self.figure.add_subplot()
+        self.ax.patch.set_alpha(0)
+        self.bars = self.ax.bar(labels, [0] * len(labels), color=color)
+        self.ax.set_ylabel(ylabel)
+        self.ax.set_title(title)
+        self.ax.grid(True, linestyle='--', alpha=0.7)
+        self.ax.margins(y=0.15)
+        self.value_labels = [
+            self.ax.text(bar.get_x() + bar.get_width()/2., 0, "", ha='center', va='bottom', rotation=0, fontsize=8)
+            for bar in self.bars
+        ]
+
+    def render(self, values, format_value):
+        for bar, text, value in zip(self.bars, self.value_labels, values):
+            bar.set_height(value)
+            text.set_y(value)
+            text.set_text(format_value(value))
+        self.ax.relim()
+        self.ax.autoscale_view()
+        return _encode_png(self.canvas)
+
+class ScalingChartRenderer:
+    """Log-log construction and per-point evaluation time against n, one measured and one fitted line per algorithm."""
+    PANELS = (("construct", "Construction"), ("evaluate", "Evaluation per point"))
+
+    def __init__(self, colors):
+        self.figure = Figure(figsize=(8, 3.4))
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.figure.patch.set_alpha(0)
+        self.figure.subplots_adjust(left=0.09, right=0.98, bottom=0.15, top=0.9, wspace=0.25)
+
+        self.axes = {}
+        self.lines = {}
+        for i, (metric, title) in enumerate(self.PANELS):
+            ax = self.figure.add_subplot(1, 2, i + 1)
+            ax.patch.set_alpha(0)
+            ax.set_xscale('log', base=2)
+            ax.set_yscale('log')
+            ax.set_xlabel("n (nodes)")
+            ax.set_ylabel("Time (seconds)")
+            ax.set_title(title)
+            ax.grid(True, which='both', linestyle='--', alpha=0.5)
+            self.axes[metric] = ax
+
+            for algorithm, color in colors.items():
+                measured, = ax.plot([], [], "o-", color=color, markersize=4, linewidth=1.5)
+                fitted, = ax.plot([], [], "--", color=color, linewidth=1, alpha=0.7)
+                self.lines[metric, algorithm] = (measured, fitted)
+
+    def render(self, series):
+        for metric, ax in self.axes.items():
+            for algorithm, data in series.items():
+                measured, fitted = self.lines[metric, algorithm]
+                measured.set_data(data["n"], data[metric])
+
+                fit = data[f"{metric}_fit"]
+                if fit:
+                    exponent, coefficient = fit
+                    ns = [data["n"][0], data["n"][-1]]
+                    fitted.set_data(ns, [coefficient * n ** exponent for n in ns])
+                    measured.set_label(f"{algorithm} (n^{exponent:.2f})")
+                else:
+                    fitted.set_data([], [])
+                    measured.set_label(algorithm)
+
+            ax.relim()
+            ax.autoscale_view()
+            ax.legend(fontsize=8, loc='upper left')
+        return _encode_png(self.canvas)
+
+def _encode_png(canvas):
+    with profiler.span("render"):
+        buf = io.BytesIO()
+        canvas.print_png(buf)
+        return base64.b64encode(buf.getvalue()).decode('utf-8')
+
+_renderers = {}
+_renderers_lock = threading.Lock()
+
+def _get_renderer(key, factory):
+    """Returns (renderer, lock) for key, building the renderer on first use."""
+    with _renderers_lock:
+        if key not in _renderers:
+            _renderers[key] = (factory(), threading.Lock())
+        return _renderers[key]
+
+def render_interpolation(x_vals, y_vals, interpolator):
+    """Returns (encoded_png, x_range, y_range) so callers can reuse the sampled curve."""
+    x_range, y_range = adaptive_sample(interpolator.interpolate_many, min(x_vals), max(x_vals), degree=len(x_vals) - 1)
+
+    renderer, lock = _get_renderer("curve", CurveRenderer)
+    with lock:
+        return renderer.render(x_range, y_range, x_vals, y_vals), x_range, y_range
+
+def render_bar_chart(key, labels, values, format_value, color, ylabel, title):
+    renderer, lock = _get_renderer(key, lambda: BarChartRenderer(labels, color, ylabel, title))
+    with lock:
+        return renderer.render(values, format_value)
+
+def render_scaling_chart(series, colors):
+    renderer, lock = _get_renderer("scaling", lambda: ScalingChartRenderer(colors))
+    with lock:
+        return renderer.render(series)
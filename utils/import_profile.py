@@ -0,0 +1,45 @@
+import os, subprocess, sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["flet", "numpy", "sympy", "utils.figure_renderer", "plotly.graph_objs", "views.compare_page", "views.graph_page"]
+
+def measure_imports(modules):
+    """
+    Imports the given modules in a fresh interpreter with `-X importtime`.
+    Returns {module: (self_us, cumulative_us)} for every module loaded.
+    """
+    code = "; ".join(f"import {module}" for module in modules)
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, cwd=PROJECT_DIR)
+
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+
+    if completed.returncode != 0:
+        print(completed.stderr.strip().splitlines()[-1])
+
+    return timings
+
+def print_import_profile(modules=None, top=25):
+    modules = modules or HEAVY_MODULES
+
+    print(f"{'Module':<40}{'Cumulative (ms)':>18}")
+    for module in modules:
+        timings = measure_imports([module])
+        cumulative = timings.get(module, (0, 0))[1]
+        print(f"{module:<40}{cumulative / 1000:>18.2f}")
+
+    timings = measure_imports(modules)
+    slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:top]
+
+    print(f"\nTop {len(slowest)} modules by self time when all are loaded together")
+    print(f"{'Module':<40}{'Self (ms)':>12}{'Cumulative (ms)':>18}")
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{name:<40}{self_us / 1000:>12.2f}{cumulative_us / 1000:>18.2f}")
+
+    total = sum(self_us for self_us, _ in timings.values())
+    print(f"\nTotal import time: {total / 1000:.2f} ms across {len(timings)} modules")
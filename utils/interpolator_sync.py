@@ -0,0 +1,25 @@
+def sync_interpolator(interpolator, interpolator_class, x_vals, y_vals):
+    """
+    Brings a live interpolator in line with the given points using its
+    add_point/remove_point/update_y methods, so a single edited row costs
+    O(n) instead of a full rebuild. Interpolators without incremental
+    support (or no previous instance) are constructed from scratch.
+    """
+    if interpolator is None or not isinstance(interpolator, interpolator_class) or not hasattr(interpolator, "add_point"):
+        return interpolator_class(x_vals, y_vals)
+
+    target = {float(x): float(y) for x, y in zip(x_vals, y_vals)}
+
+    for i in range(len(interpolator.x_vals) - 1, -1, -1):
+        if interpolator.x_vals[i] not in target:
+            interpolator.remove_point(i)
+
+    for i, x in enumerate(interpolator.x_vals):
+        y = target.pop(x)
+        if y != interpolator.y_vals[i]:
+            interpolator.update_y(i, y)
+
+    for x, y in target.items():
+        interpolator.add_point(x, y)
+
+    return interpolator
@@ -0,0 +1,80 @@
+import threading
+
+class JobCancelled(Exception):
+    pass
+
+class Job:
+    def __init__(self, job_id):
+        self.job_id = job_id
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled(f"Job {self.job_id} was superseded.")
+
+class JobRunner:
+    """
+    Runs calculate requests on a single background thread, latest wins:
+    submitting a job cancels the running one (it stops at its next
+    raise_if_cancelled checkpoint) and replaces any job still waiting.
+    The target is called as target(*args, job=job).
+    """
+    def __init__(self, on_error=None):
+        self.on_error = on_error
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._running = None
+        self._pending = None
+        self._worker = None
+
+    def submit(self, target, *args):
+        with self._lock:
+            self._next_id += 1
+            job = Job(self._next_id)
+
+            if self._running:
+                self._running.cancel()
+            if self._pending:
+                self._pending[0].cancel()
+            self._pending = (job, target, args)
+
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+
+        return job
+
+    def cancel_all(self):
+        with self._lock:
+            if self._running:
+                self._running.cancel()
+            if self._pending:
+                self._pending[0].cancel()
+            self._pending = None
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if self._pending is None:
+                    self._running = None
+                    self._worker = None
+                    return
+                job, target, args = self._pending
+                self._pending = None
+                self._running = job
+
+            try:
+                job.raise_if_cancelled()
+                target(*args, job=job)
+            except JobCancelled:
+                print(f"Job {job.job_id} cancelled")
+            except Exception as ex:
+                if self.on_error:
+                    self.on_error(ex)
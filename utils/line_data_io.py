@@ -56,6 +56,7 @@ def load_lines_code(panel):
 
         panel.lines.clear()
         panel.line_column.controls.clear()
+        panel.line_revisions.clear()
 
         hex_color_pattern = re.compile(r"^#(?:[0-9a-fA-F]{6})$")
 
@@ -0,0 +1,138 @@
+import math, time, threading
+
+SPANS = ("construct", "weights", "evaluate", "stability", "coefficients", "render", "write")
+# Histogram bucket upper bounds in seconds: half-decade steps from 1 µs to 10 s.
+BUCKET_BOUNDS = tuple(10 ** (exponent / 2) for exponent in range(-12, 3))
+
+class SpanStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(BUCKET_BOUNDS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (0 < q <= 100), capped at the maximum."""
+        target = q / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return min(BUCKET_BOUNDS[i], self.max) if i < len(BUCKET_BOUNDS) else self.max
+        return 0.0
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class Profiler:
+    """
+    Named timing spans, used as `with profiler.span("evaluate"): ...`.
+
+    While enabled, every span is added to a per-name histogram. Spans are
+    also timed, without touching the histograms, whenever a collect()
+    block is open on the current thread, and added to its totals. Otherwise
+    span() hands back a shared no-op context manager, so instrumented code
+    pays for two attribute checks.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def span(self, name):
+        if not self.enabled and not getattr(self._local, "collectors", None):
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name, seconds):
+        if self.enabled:
+            with self._lock:
+                stats = self.stats.get(name)
+                if stats is None:
+                    stats = self.stats[name] = SpanStats()
+                stats.add(seconds)
+
+        for totals in getattr(self._local, "collectors", ()):
+            totals[name] = totals.get(name, 0.0) + seconds
+
+    def collect(self):
+        """
+        Context manager yielding a dict of span name -> seconds, filled
+        with the spans the current thread records inside the block.
+        """
+        return _Collector(self)
+
+    def reset(self):
+        with self._lock:
+            self.stats = {}
+
+    def report(self):
+        with self._lock:
+            stats = dict(self.stats)
+
+        lines = [f"{'span':<14}{'count':>8}{'total ms':>12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+        for name in sorted(stats, key=lambda name: SPANS.index(name) if name in SPANS else len(SPANS)):
+            s = stats[name]
+            lines.append(
+                f"{name:<14}{s.count:>8}{s.total * 1e3:>12.2f}{s.total / s.count * 1e3:>10.3f}"
+                f"{s.percentile(50) * 1e3:>10.3f}{s.percentile(95) * 1e3:>10.3f}{s.max * 1e3:>10.3f}"
+            )
+        return "\n".join(lines)
+
+class _Collector:
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.totals = {}
+
+    def __enter__(self):
+        local = self.profiler._local
+        if not hasattr(local, "collectors"):
+            local.collectors = []
+        local.collectors.append(self.totals)
+        return self.totals
+
+    def __exit__(self, *exc_info):
+        self.profiler._local.collectors.pop()
+        return False
+
+profiler = Profiler()
+
+def enable_profiling():
+    profiler.enabled = True
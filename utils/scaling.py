@@ -0,0 +1,82 @@
+import numpy as np
+
+from algorithms.lagrange import LagrangeInterpolator
+from algorithms.newton import NewtonInterpolator
+from algorithms.barycentric import BarycentricInterpolator
+from utils.timing import generate_nodes, sample_values, best_time
+
+# Same configurations as the Compare page, which evaluates Lagrange in reference mode.
+SCALING_ALGORITHMS = {
+    "Lagrange": lambda x_vals, y_vals: LagrangeInterpolator(x_vals, y_vals, mode="reference"),
+    "Newton": NewtonInterpolator,
+    "Barycentric": BarycentricInterpolator,
+}
+
+def scaling_sizes(start=8, stop=1024):
+    """Node counts doubling from start up to stop."""
+    sizes = []
+    n = start
+    while n <= stop:
+        sizes.append(n)
+        n *= 2
+    return sizes
+
+def fit_power_law(sizes, times, min_points=3):
+    """
+    Least-squares fit of t = c·nᵖ on log-log axes over the larger half of
+    the sizes, where lower-order terms and call overhead have died out.
+    Returns (p, c), or None with fewer than two usable points.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    times = np.asarray(times, dtype=float)
+    usable = times > 0
+    sizes, times = sizes[usable], times[usable]
+    if len(sizes) < 2:
+        return None
+
+    tail = max(min_points, len(sizes) // 2 + 1)
+    exponent, log_coefficient = np.polyfit(np.log(sizes[-tail:]), np.log(times[-tail:]), 1)
+    return float(exponent), float(np.exp(log_coefficient))
+
+def measure_scaling(sizes=None, grid=200, warmup=1, repeat=3, time_budget=0.5, job=None, progress=None):
+    """
+    Times construction and `grid`-point evaluation for every algorithm over
+    Chebyshev nodes of each size. An algorithm stops growing n once one of
+    its timings exceeds `time_budget` seconds.
+
+    progress: (optional) called as progress(algorithm, n) before each case
+    Returns {algorithm: {"n", "construct", "evaluate", "construct_fit", "evaluate_fit"}}
+    with evaluate as seconds per evaluated point.
+    """
+    sizes = sizes or scaling_sizes()
+    xs = np.linspace(-1.0, 1.0, grid)
+    series = {}
+
+    for algorithm, build in SCALING_ALGORITHMS.items():
+        measured = {"n": [], "construct": [], "evaluate": []}
+
+        for n in sizes:
+            if job:
+                job.raise_if_cancelled()
+            if progress:
+                progress(algorithm, n)
+
+            x_vals = generate_nodes("chebyshev", n).tolist()
+            y_vals = sample_values(np.asarray(x_vals)).tolist()
+            with np.errstate(all="ignore"):
+                construct = best_time(lambda: build(x_vals, y_vals), warmup, repeat)
+                interpolator = build(x_vals, y_vals)
+                evaluate = best_time(lambda: interpolator.interpolate_many(xs), warmup, repeat)
+
+            measured["n"].append(n)
+            measured["construct"].append(construct)
+            measured["evaluate"].append(evaluate / grid)
+
+            if max(construct, evaluate) > time_budget:
+                break
+
+        measured["construct_fit"] = fit_power_law(measured["n"], measured["construct"])
+        measured["evaluate_fit"] = fit_power_law(measured["n"], measured["evaluate"])
+        series[algorithm] = measured
+
+    return series
@@ -1,16 +1,143 @@
 import http.server
-import socketserver
 import threading
-import os
+import os, json, math, functools
+from urllib.parse import urlparse, parse_qs
+
+from utils.result_cache import LRUCache
+from utils.artifact_store import ArtifactStore, brotli
 
 PORT = 8000
 SERVE_DIR = os.path.abspath("temp_html")
+MAX_RESAMPLE_POINTS = 5000
+MIN_COMPRESS_BYTES = 1024
+
+artifact_store = ArtifactStore(SERVE_DIR)
+
+def publish_artifact(name, content, content_type=None):
+    """Stores content under its hash and returns an immutable URL for it."""
+    filename = artifact_store.publish(name, content, content_type)
+    return f"http://localhost:{PORT}/a/{filename}"
+
+_graph_registry = LRUCache(max_entries=8)
+_registry_lock = threading.Lock()
+
+def register_graph(graph_id, curves):
+    """
+    curves: list of (interpolator, x_min, x_max) in the order of the
+    graph's line traces, used to answer /resample requests for graph_id.
+    """
+    with _registry_lock:
+        _graph_registry.put(graph_id, curves)
+
+def resample_graph(graph_id, x0, x1, num_points):
+    from utils.adaptive_sampling import adaptive_sample
+
+    with _registry_lock:
+        curves = _graph_registry.get(graph_id)
+    if curves is None:
+        return None
+
+    resampled = []
+    for interpolator, x_min, x_max in curves:
+        lo, hi = max(x0, x_min), min(x1, x_max)
+        if lo >= hi:
+            resampled.append({"x": [], "y": []})
+            continue
+
+        xs, ys = adaptive_sample(interpolator.interpolate_many, lo, hi, degree=len(interpolator.x_vals) - 1, max_points=num_points)
+        resampled.append({"x": xs.tolist(), "y": [y if math.isfinite(y) else None for y in ys.tolist()]})
+
+    return resampled
+
+class ArtifactRequestHandler(http.server.SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == "/resample":
+            self.handle_resample(parse_qs(parsed.query))
+            return
+
+        if parsed.path.startswith("/a/"):
+            filename, artifact = artifact_store.get(filename=parsed.path[len("/a/"):])
+            immutable = True
+        else:
+            filename, artifact = artifact_store.get(name=parsed.path.lstrip("/"))
+            immutable = False
+
+        if artifact is None:
+            super().do_GET()
+            return
+
+        self.send_artifact(filename, artifact, immutable)
+
+    def send_artifact(self, filename, artifact, immutable):
+        etag = f'"{os.path.splitext(filename)[0]}"'
+        cache_control = "public, max-age=31536000, immutable" if immutable else "no-cache"
+
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = artifact["body"]
+        encoding = None
+        if len(body) >= MIN_COMPRESS_BYTES:
+            accepted = self.headers.get("Accept-Encoding", "")
+            if brotli is not None and "br" in accepted:
+                encoding = "br"
+            elif "gzip" in accepted:
+                encoding = "gzip"
+        if encoding:
+            body = artifact_store.encoded_body(artifact, encoding)
+
+        self.send_response(200)
+        self.send_header("Content-Type", artifact["content_type"])
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", cache_control)
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_resample(self, query):
+        try:
+            graph_id = query["graph"][0]
+            x0 = float(query["x0"][0])
+            x1 = float(query["x1"][0])
+            num_points = max(2, min(int(query.get("n", ["800"])[0]), MAX_RESAMPLE_POINTS))
+            if not (math.isfinite(x0) and math.isfinite(x1) and x0 < x1):
+                raise ValueError
+        except (KeyError, ValueError):
+            self.send_error(400, "Expected graph, finite x0 < x1 and optional n query parameters.")
+            return
+
+        curves = resample_graph(graph_id, x0, x1, num_points)
+        if curves is None:
+            self.send_error(404, f"Unknown graph: {graph_id}")
+            return
+
+        body = json.dumps({"curves": curves}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
 
 def start_server():
     os.makedirs(SERVE_DIR, exist_ok=True)
-    os.chdir(SERVE_DIR)
-    handler = http.server.SimpleHTTPRequestHandler
-    with socketserver.TCPServer(("", PORT), handler) as httpd:
+    artifact_store.prune_disk()
+    handler = functools.partial(ArtifactRequestHandler, directory=SERVE_DIR)
+    with http.server.ThreadingHTTPServer(("", PORT), handler) as httpd:
         print(f"Serving at http://localhost:{PORT}")
         httpd.serve_forever()
 
@@ -4,4 +4,36 @@ def to_digit_subscript(n: int) -> str:
 
 def to_digit_superscript(n: int) -> str:
     superscript_digits = str.maketrans("0123456789-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁻")
-    return str(n).translate(superscript_digits)
\ No newline at end of file
+    return str(n).translate(superscript_digits)
+
+def to_unicode_poly_string(coefficients) -> str:
+    coeffs = [float(c) for c in coefficients]
+    while len(coeffs) > 1 and coeffs[-1] == 0:
+        coeffs.pop()
+
+    terms = []
+    for power in range(len(coeffs) - 1, -1, -1):
+        coeff = coeffs[power]
+        if coeff == 0:
+            continue
+        sign = "-" if coeff < 0 else "+"
+        abs_coeff = abs(coeff)
+        coeff_str = f"{abs_coeff:.4f}".rstrip("0").rstrip(".") if abs_coeff != 1 or power == 0 else ""
+
+        if power == 0:
+            term = f"{coeff_str}"
+        elif power == 1:
+            term = f"{coeff_str}x"
+        else:
+            term = f"{coeff_str}x{to_digit_superscript(power)}"
+
+        terms.append((sign, term))
+
+    if not terms:
+        return "0"
+
+    result = terms[0][1] if terms[0][0] == "+" else f"-{terms[0][1]}"
+    for sign, term in terms[1:]:
+        result += f" {sign} {term}"
+
+    return result
@@ -0,0 +1,40 @@
+import time
+import numpy as np
+
+DISTRIBUTIONS = ("uniform", "chebyshev", "random", "clustered")
+
+def generate_nodes(distribution, n, seed=0):
+    """Sorted, distinct x-values on [-1, 1] for the given distribution."""
+    rng = np.random.default_rng(seed)
+
+    if distribution == "uniform":
+        nodes = np.linspace(-1.0, 1.0, n)
+    elif distribution == "chebyshev":
+        nodes = np.cos((2 * np.arange(n) + 1) * np.pi / (2 * n))
+    elif distribution == "random":
+        nodes = rng.uniform(-1.0, 1.0, n)
+    elif distribution == "clustered":
+        centers = np.linspace(-0.75, 0.75, 4)
+        nodes = np.clip(rng.choice(centers, n) + rng.normal(0.0, 0.05, n), -1.0, 1.0)
+    else:
+        raise ValueError(f"Unknown node distribution: {distribution}")
+
+    nodes = np.unique(nodes)
+    while len(nodes) < n:
+        nodes = np.unique(np.append(nodes, rng.uniform(-1.0, 1.0, n - len(nodes))))
+    return nodes
+
+def sample_values(nodes):
+    return np.sin(np.pi * nodes) + 0.5 * np.cos(3 * np.pi * nodes)
+
+def best_time(func, warmup=1, repeat=5):
+    """Minimum wall time of `repeat` calls after `warmup` untimed ones."""
+    for _ in range(warmup):
+        func()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
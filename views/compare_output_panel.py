@@ -1,15 +1,20 @@
-import base64, io, matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import flet as ft
 from flet import Image, ImageFit
+from concurrent.futures import as_completed
 
 from algorithms.lagrange import LagrangeInterpolator
 from algorithms.newton import NewtonInterpolator
 from algorithms.barycentric import BarycentricInterpolator
-from utils.static_cartesian_plot import graph_lagrange, graph_newton, graph_barycentric
+from utils.compare_compute import get_compare_executor, compute_interpolation
+from algorithms.diagnostics import compute_diagnostics
+from utils.figure_renderer import render_bar_chart, render_scaling_chart
+from utils.scaling import measure_scaling
+from utils.interpolator_sync import sync_interpolator
+from utils.profiling import profiler
 
 class CompareOutputPanel(ft.Container):
+    SCALING_COLORS = {"Lagrange": "#2196F3", "Newton": "#18A045", "Barycentric": "#A01823"}
+
     def __init__(self):
         super().__init__(padding=10, alignment=ft.alignment.top_left, expand=True)
 
@@ -19,6 +24,19 @@ class CompareOutputPanel(ft.Container):
         self.expressions = ["", "", ""]
         self.time_taken = [0.0, 0.0, 0.0]
         self.numerical_stability = [0.0, 0.0, 0.0]
+        self.diagnostics = None
+        self.live_newton = None
+        self.live_barycentric = None
+        self.on_run_scaling = None
+
+        self.mode_selector = ft.RadioGroup(content=ft.Row([
+                ft.Radio(value="Compare", label="Compare", fill_color="#2196F3"),
+                ft.Radio(value="Scaling", label="Scaling", fill_color="#2196F3"),
+            ], alignment=ft.MainAxisAlignment.START),
+            value="Compare", on_change=self.on_mode_change,
+        )
+        self.scaling_button = ft.ElevatedButton("Run Scaling", icon=ft.icons.SPEED, icon_color="#FFFFFF", visible=False,
+            on_click=lambda e: self.on_run_scaling and self.on_run_scaling(), style=ft.ButtonStyle(bgcolor={"": "#2196F3"}, color={"": "#FFFFFF"}))
 
         for i in range(3):
             graph_display = ft.Text("Insert data points\nto create graph.", size=16, color="#888888", text_align=ft.TextAlign.CENTER)
@@ -56,16 +74,57 @@ class CompareOutputPanel(ft.Container):
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN, vertical_alignment=ft.CrossAxisAlignment.START, expand=True
         )
 
+        self.scaling_status = ft.Text("Run a scaling sweep to time each algorithm over growing node counts.", size=14, color="#888888")
+        self.scaling_chart = ft.Container(content=ft.Text("No scaling results yet.", size=16, color="#888888", text_align=ft.TextAlign.CENTER),
+            bgcolor="#ffffff", alignment=ft.alignment.center, border_radius=10, padding=10, expand=True)
+        self.scaling_summary = ft.Column(spacing=5)
+        self.scaling_view = ft.Column([self.scaling_status, self.scaling_chart, self.scaling_summary], visible=False, expand=True, spacing=10)
+
         self.content = ft.Column(
             [
-                ft.Text("Graphs and Information", size=18, weight=ft.FontWeight.BOLD),
+                ft.Row([
+                    ft.Text("Graphs and Information", size=18, weight=ft.FontWeight.BOLD),
+                    self.mode_selector,
+                    self.scaling_button,
+                ], alignment=ft.MainAxisAlignment.START, spacing=20),
                 self.output_row,
-                self.bottom_row
+                self.bottom_row,
+                self.scaling_view
             ],
             alignment=ft.MainAxisAlignment.START, expand=True
         )
 
-    def update_output(self, x_vals, y_vals):
+    def on_mode_change(self, e):
+        scaling = e.control.value == "Scaling"
+        self.output_row.visible = not scaling
+        self.bottom_row.visible = not scaling
+        self.scaling_view.visible = scaling
+        self.scaling_button.visible = scaling
+        self.update()
+
+    def run_scaling(self, job=None):
+        def on_progress(algorithm, n):
+            self.scaling_status.value = f"Timing {algorithm} with n = {n}..."
+            self.update()
+
+        self.scaling_status.color = "#888888"
+        series = measure_scaling(job=job, progress=on_progress)
+        chart_base64 = render_scaling_chart(series, self.SCALING_COLORS)
+
+        self.scaling_status.value = "Best of 3 runs on Chebyshev nodes; evaluation is timed over 200 points. Dashed lines are power-law fits."
+        self.scaling_chart.content = ft.Image(src_base64=chart_base64, fit=ft.ImageFit.CONTAIN, expand=True)
+        self.scaling_summary.controls = [
+            ft.Text(f"{algorithm}: construction {self.format_exponent(data['construct_fit'])}, "
+                    f"evaluation {self.format_exponent(data['evaluate_fit'])} per point (up to n = {data['n'][-1]})", size=14, color="#FFFFFF")
+            for algorithm, data in series.items()
+        ]
+        self.update()
+
+    @staticmethod
+    def format_exponent(fit):
+        return f"O(n^{fit[0]:.2f})" if fit else "not enough points"
+
+    def update_output(self, x_vals, y_vals, job=None):
         for i in range(3):
             self.graph_columns[i].controls[1].content.content = ft.Text("Computing...", size=16, color="#888888", text_align=ft.TextAlign.CENTER)
         
@@ -74,36 +133,40 @@ class CompareOutputPanel(ft.Container):
         self.stability_chart.controls = [ft.Text("Loading...", size=16, color="#888888", text_align=ft.TextAlign.CENTER)]
         self.update()
 
-        self.graph_columns[0].controls[1].content.content = ft.Text("Computing...", size=16, color="#888888", text_align=ft.TextAlign.CENTER)
-        self.graph_columns[1].controls[1].content.content = ft.Text("Waiting for the\nfirst algorithm...", size=16, color="#888888", text_align=ft.TextAlign.CENTER)
-        self.graph_columns[2].controls[1].content.content = ft.Text("Waiting for the\nsecond algorithm...", size=16, color="#888888", text_align=ft.TextAlign.CENTER)
-        self.update()
-        lagrange_results = self.compute_lagrange(x_vals, y_vals)
-        self.update_lagrange_ui(lagrange_results)
-
-        self.graph_columns[1].controls[1].content.content = ft.Text("Computing...", size=16, color="#888888", text_align=ft.TextAlign.CENTER)
-        self.graph_columns[2].controls[1].content.content = ft.Text("Waiting for the\nsecond algorithm...", size=16, color="#888888", text_align=ft.TextAlign.CENTER)
-        self.update()
-        newton_results = self.compute_newton(x_vals, y_vals)
-        self.update_newton_ui(newton_results)
-
-        self.graph_columns[2].controls[1].content.content = ft.Text("Computing...", size=16, color="#888888", text_align=ft.TextAlign.CENTER)
-        self.update()
-        barycentric_results = self.compute_barycentric(x_vals, y_vals)
-        self.update_barycentric_ui(barycentric_results)
-
+        results = [(None, None, None, None)] * 3
+        if x_vals and y_vals and len(x_vals) > 1:
+            newton_poly = sync_interpolator(self.live_newton, NewtonInterpolator, x_vals, y_vals)
+            barycentric_poly = sync_interpolator(self.live_barycentric, BarycentricInterpolator, x_vals, y_vals)
+            jobs = [
+                (LagrangeInterpolator(x_vals, y_vals, mode="reference"), self.update_lagrange_ui),
+                (newton_poly, self.update_newton_ui),
+                (barycentric_poly, self.update_barycentric_ui),
+            ]
+
+            executor = get_compare_executor()
+            futures = {executor.submit(compute_interpolation, x_vals, y_vals, poly): (i, update_ui) for i, (poly, update_ui) in enumerate(jobs)}
+            for future in as_completed(futures):
+                if job and job.cancelled:
+                    for pending in futures:
+                        pending.cancel()
+                    job.raise_if_cancelled()
+
+                i, update_ui = futures[future]
+                poly, time_taken, encoded_image, numerical_stability, spans = future.result()
+                results[i] = (poly, time_taken, encoded_image, numerical_stability)
+                for name, seconds in spans.items():
+                    profiler.record(name, seconds)
+                update_ui(results[i])
+
+        self.live_newton = results[1][0]
+        self.live_barycentric = results[2][0]
+        self.diagnostics = compute_diagnostics(x_vals) if x_vals and len(x_vals) > 1 else None
+
+        if job:
+            job.raise_if_cancelled()
         self.update_time_chart()
         self.update_stability_chart()
-        self.update_polynomial_info(lagrange_results[0], newton_results[0], barycentric_results[0])
-
-    def compute_lagrange(self, x_vals, y_vals):
-        if x_vals and y_vals and len(x_vals) > 1:
-            lagrange_poly = LagrangeInterpolator(x_vals, y_vals)
-            encoded_image = graph_lagrange(x_vals, y_vals, lagrange_poly)
-            time_taken = lagrange_poly.get_evaluation_only_time()
-            numerical_stability = lagrange_poly.get_numerical_stability()
-            return lagrange_poly, time_taken, encoded_image, numerical_stability
-        return None, None, None, None, None
+        self.update_polynomial_info(results[0][0], results[1][0], results[2][0])
 
     def update_lagrange_ui(self, results):
         lagrange_poly, time_taken, encoded_image, numerical_stability = results
@@ -114,15 +177,6 @@ class CompareOutputPanel(ft.Container):
         
         self.update()
 
-    def compute_newton(self, x_vals, y_vals):
-        if x_vals and y_vals and len(x_vals) > 1:
-            newton_poly = NewtonInterpolator(x_vals, y_vals)
-            encoded_image = graph_newton(x_vals, y_vals, newton_poly)
-            time_taken = newton_poly.get_evaluation_only_time()
-            numerical_stability = newton_poly.get_numerical_stability()
-            return newton_poly, time_taken, encoded_image, numerical_stability
-        return None, None, None, None, None
-
     def update_newton_ui(self, results):
         newton_poly, time_taken, encoded_image, numerical_stability = results
         if newton_poly:
@@ -132,15 +186,6 @@ class CompareOutputPanel(ft.Container):
         
         self.update()
 
-    def compute_barycentric(self, x_vals, y_vals):
-        if x_vals and y_vals and len(x_vals) > 1:
-            barycentric_poly = BarycentricInterpolator(x_vals, y_vals)
-            encoded_image = graph_barycentric(x_vals, y_vals, barycentric_poly)
-            time_taken = barycentric_poly.get_evaluation_only_time()
-            numerical_stability = barycentric_poly.get_numerical_stability()
-            return barycentric_poly, time_taken, encoded_image, numerical_stability
-        return None, None, None, None, None
-
     def update_barycentric_ui(self, results):
         barycentric_poly, time_taken, encoded_image, numerical_stability = results
         if barycentric_poly:
@@ -152,24 +197,11 @@ class CompareOutputPanel(ft.Container):
 
     def update_time_chart(self):
         labels = ["Lagrange", "Newton", "Barycentric"]
-
-        fig, ax = plt.subplots(figsize=(4, 3))
-        bars = ax.bar(labels, self.time_taken, color='#2196F3')
-        ax.set_ylabel('Time (seconds)')
-        ax.set_title('Interpolation Time Comparison')
-        ax.grid(True, linestyle='--', alpha=0.7)
-
-        for bar, time in zip(bars, self.time_taken):
-            height = bar.get_height()
-            label = f"{time*1000:.2f} ms" if time < 1 else f"{time:.4f} s"
-            ax.text(bar.get_x() + bar.get_width()/2., height, label, ha='center', va='bottom', rotation=0, fontsize=8)
-
-        buf = io.BytesIO()
-        plt.tight_layout()
-        plt.savefig(buf, format='png', bbox_inches='tight', transparent=True)
-        buf.seek(0)
-        time_chart_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close(fig)
+        time_chart_base64 = render_bar_chart(
+            "time", labels, self.time_taken,
+            lambda time: f"{time*1000:.2f} ms" if time < 1 else f"{time:.4f} s",
+            color='#2196F3', ylabel='Time (seconds)', title='Interpolation Time Comparison'
+        )
 
         self.time_chart.controls = [
             ft.Text("Time Taken", size=16, weight=ft.FontWeight.BOLD, color="#000000"),
@@ -179,30 +211,35 @@ class CompareOutputPanel(ft.Container):
 
     def update_stability_chart(self):
         labels = ["Lagrange", "Newton", "Barycentric"]
-
-        fig, ax = plt.subplots(figsize=(4, 3))
-        bars = ax.bar(labels, self.numerical_stability, color='#18A045')
-        ax.set_ylabel('Stability Measure')
-        ax.set_title('Numerical Stability Comparison')
-        ax.grid(True, linestyle='--', alpha=0.7)
-
-        for bar, stability in zip(bars, self.numerical_stability):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height, f'{stability:.4f}', ha='center', va='bottom', rotation=0, fontsize=8)
-
-        buf = io.BytesIO()
-        plt.tight_layout()
-        plt.savefig(buf, format='png', bbox_inches='tight', transparent=True)
-        buf.seek(0)
-        stability_chart_base64 = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close(fig)
+        stability_chart_base64 = render_bar_chart(
+            "stability", labels, self.numerical_stability,
+            lambda stability: f'{stability:.4f}',
+            color='#18A045', ylabel='Stability Measure', title='Numerical Stability Comparison'
+        )
 
         self.stability_chart.controls = [
             ft.Text("Numerical Stability", size=16, weight=ft.FontWeight.BOLD, color="#000000"),
             ft.Image(src_base64=stability_chart_base64, fit=ft.ImageFit.CONTAIN, expand=True)
-        ]
+        ] + self.build_diagnostics_text()
         self.update()
 
+    def build_diagnostics_text(self):
+        if not self.diagnostics:
+            return []
+
+        rows = [
+            ("Lebesgue constant Λ", self.diagnostics["lebesgue_constant"], 1e3),
+            ("Newton basis condition κ∞", self.diagnostics["newton_condition"], 1e12),
+            ("Barycentric weight range", self.diagnostics["weight_range"], 1e12),
+        ]
+
+        controls = []
+        for label, value, warn_threshold in rows:
+            color = "#A01823" if value >= warn_threshold else "#000000"
+            prefix = "⚠ " if value >= warn_threshold else ""
+            controls.append(ft.Text(f"{prefix}{label}: {value:.3g}", size=12, color=color))
+        return controls
+
     def update_polynomial_info(self, lagrange_poly, newton_poly, barycentric_poly):
         self.polynomial_info.controls = [ft.Text("Evaluating f(x) from graphs...", size=16, color="#888888", text_align=ft.TextAlign.CENTER)]
         self.update()
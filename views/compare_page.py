@@ -1,12 +1,19 @@
 import flet as ft
 from views.compare_input_panel import CompareInputPanel
 from views.compare_output_panel import CompareOutputPanel
+from utils.job_runner import JobRunner
 from utils.validation import compare_validate_data
 
 def build_compare_page(page: ft.Page):
     input_panel = CompareInputPanel()
     output_panel = CompareOutputPanel()
 
+    def on_error(ex):
+        page.open(ft.SnackBar(content=ft.Text(f"Error: {str(ex)}"), bgcolor=ft.colors.ERROR))
+        print(f"Error: {str(ex)}")
+
+    job_runner = JobRunner(on_error=on_error)
+
     def on_calculate(e):
         x_vals, y_vals = input_panel.get_data()
         is_valid, error_message = compare_validate_data(x_vals, y_vals)
@@ -14,11 +21,9 @@ def build_compare_page(page: ft.Page):
             page.open(ft.SnackBar(content=ft.Text(error_message), bgcolor=ft.colors.ERROR))
             return
 
-        try:
-            output_panel.update_output(x_vals, y_vals)
-        except Exception as ex:
-            page.open(ft.SnackBar(content=ft.Text(f"Error: {str(ex)}"), bgcolor=ft.colors.ERROR))
-            print(f"Error: {str(ex)}")
+        job_runner.submit(output_panel.update_output, x_vals, y_vals)
+
+    output_panel.on_run_scaling = lambda: job_runner.submit(output_panel.run_scaling)
 
     input_container = ft.Container(content=input_panel.build_with_button(on_calculate, page=page), expand=1, padding=10)
     output_container = ft.Container(content=output_panel, expand=4, padding=10)
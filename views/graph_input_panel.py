@@ -13,6 +13,8 @@ class GraphInputPanel(ft.Container):
         self.label_color = "#ACAFB8"
 
         self.lines = []
+        self.next_line_id = 0
+        self.line_revisions = {}
         self.line_column = ft.Column(scroll=ft.ScrollMode.AUTO, alignment=ft.MainAxisAlignment.START, expand=True)
         self.add_line_button = ft.ElevatedButton("Add Line", icon=ft.icons.LINE_WEIGHT_ROUNDED, icon_color="#FFFFFF", on_click=lambda e: self.add_line(), style=ft.ButtonStyle(bgcolor={"": "#2196F3"}, color={"": "#FFFFFF"}))
         self.save_button = ft.ElevatedButton("Save", icon=ft.icons.SAVE, icon_color="#FFFFFF", on_click=lambda e: save_lines_web(self.lines), style=ft.ButtonStyle(bgcolor={"": "#18A045"}, color={"": "#FFFFFF"}))
@@ -35,8 +37,13 @@ class GraphInputPanel(ft.Container):
         
         self.content = ft.Stack([self.main_content, self.color_picker_popup])
 
+    def mark_line_dirty(self, line_id):
+        if line_id in self.line_revisions:
+            self.line_revisions[line_id] += 1
+
     def validate_float_input(self, e):
         text_field = e.control
+        self.mark_line_dirty(text_field.data)
         value = text_field.value.strip()
         if not value:
             return
@@ -51,13 +58,13 @@ class GraphInputPanel(ft.Container):
 
         text_field.update()
 
-    def create_data_row(self, line_index, point_index, on_delete):
+    def create_data_row(self, line_index, point_index, on_delete, line_id=None):
         x_input = ft.TextField(width=80, keyboard_type=ft.KeyboardType.NUMBER, on_change=self.validate_float_input,
             border_color=self.border_color, label=f"x{to_digit_subscript(point_index + 1)}",
-            label_style=ft.TextStyle(color=self.label_color))
+            label_style=ft.TextStyle(color=self.label_color), data=line_id)
         y_input = ft.TextField(width=80, keyboard_type=ft.KeyboardType.NUMBER, on_change=self.validate_float_input,
             border_color=self.border_color, label=f"y{to_digit_subscript(point_index + 1)}",
-            label_style=ft.TextStyle(color=self.label_color))
+            label_style=ft.TextStyle(color=self.label_color), data=line_id)
 
         controls = [x_input, y_input]
 
@@ -70,6 +77,9 @@ class GraphInputPanel(ft.Container):
 
     def add_line(self, label=None, color=None, points=None):
         line_index = len(self.lines)
+        line_id = self.next_line_id
+        self.next_line_id += 1
+        self.line_revisions[line_id] = 0
         color = color or random.choice(self.COLORS)
 
         color_button = ft.Button(width=30, height=30, bgcolor=color, text=" ", tooltip="Select Color")
@@ -77,7 +87,8 @@ class GraphInputPanel(ft.Container):
             btn, idx, top_offset=30, left_offset=70)
 
         label_input = ft.TextField(width=150, value=label or "", border_color=self.border_color,
-            label=f"Line {line_index + 1}", label_style=ft.TextStyle(color=self.label_color))
+            label=f"Line {line_index + 1}", label_style=ft.TextStyle(color=self.label_color), data=line_id,
+            on_change=lambda e: self.mark_line_dirty(line_id))
         add_row_button = ft.IconButton(icon=ft.icons.ADD_CIRCLE, icon_color="blue", tooltip="Add Row",
             on_click=lambda e, idx=line_index: self.add_data_row(idx))
         delete_line_button = ft.IconButton(icon=ft.icons.DELETE_ROUNDED, icon_color="red", tooltip="Delete Line",
@@ -91,9 +102,10 @@ class GraphInputPanel(ft.Container):
 
         def add_row_fn():
             idx = len(data_rows)
-            row_data = self.create_data_row(line_index, idx, on_delete=lambda e, i=idx: self.delete_data_row(line_index, i))
+            row_data = self.create_data_row(line_index, idx, on_delete=lambda e, i=idx: self.delete_data_row(line_index, i), line_id=line_id)
             data_rows.append(row_data)
             row_column.controls.append(row_data[0])
+            self.mark_line_dirty(line_id)
             self.lines[line_index] = self.lines[line_index][:3] + (data_rows, row_column) + self.lines[line_index][5:]
             self.update()
 
@@ -101,6 +113,7 @@ class GraphInputPanel(ft.Container):
             if 0 <= i < len(data_rows):
                 del data_rows[i]
                 del row_column.controls[i]
+                self.mark_line_dirty(line_id)
                 self.relabel_data_rows(line_index, data_rows, row_column)
                 self.update()
 
@@ -110,7 +123,7 @@ class GraphInputPanel(ft.Container):
 
         if points:
             for idx, (x, y) in enumerate(points):
-                row_data = self.create_data_row(line_index, idx, on_delete=lambda e, i=idx: self.delete_data_row(line_index, i))
+                row_data = self.create_data_row(line_index, idx, on_delete=lambda e, i=idx: self.delete_data_row(line_index, i), line_id=line_id)
                 row_data[1].value = str(x)
                 row_data[2].value = str(y)
                 data_rows.append(row_data)
@@ -131,6 +144,7 @@ class GraphInputPanel(ft.Container):
     def delete_line(self, line_index):
         if len(self.lines) <= 1:
             return
+        self.line_revisions.pop(self.lines[line_index][1].data, None)
         del self.lines[line_index]
         del self.line_column.controls[line_index]
         self.relabel_all_lines()
@@ -140,7 +154,7 @@ class GraphInputPanel(ft.Container):
         row_column.controls.clear()
         new_rows = []
         for i, (_, x_input, y_input) in enumerate(data_rows):
-            row_data = self.create_data_row(line_index, i, on_delete=lambda e, idx=i: self.delete_data_row(line_index, idx))
+            row_data = self.create_data_row(line_index, i, on_delete=lambda e, idx=i: self.delete_data_row(line_index, idx), line_id=x_input.data)
             row_data[1].value = x_input.value
             row_data[2].value = y_input.value
             new_rows.append(row_data)
@@ -171,13 +185,15 @@ class GraphInputPanel(ft.Container):
                     continue
 
             if len(x_vals) >= 2:
-                results.append({"x_vals": x_vals, "y_vals": y_vals, "label": label_input.value.strip(), "color": color})
+                results.append({"x_vals": x_vals, "y_vals": y_vals, "label": label_input.value.strip(), "color": color,
+                    "line_id": label_input.data, "revision": self.line_revisions.get(label_input.data)})
         return results
 
     def show_color_picker(self, color_button, line_index, top_offset=0, left_offset=0):
         def select_color(color):
             color_button.bgcolor = color
             self.lines[line_index] = self.lines[line_index][:2] + (color,) + self.lines[line_index][3:]
+            self.mark_line_dirty(self.lines[line_index][1].data)
             self.color_picker_popup.visible = False
             self.update()
 
@@ -1,15 +1,22 @@
-import os
+import copy
 import flet as ft
 import hashlib
 
-from utils.server import SERVE_DIR
+from utils.server import publish_artifact, register_graph
 from algorithms.lagrange import LagrangeInterpolator
 from algorithms.newton import NewtonInterpolator
 from algorithms.barycentric import BarycentricInterpolator
-from utils.dynamic_cartesian_plot import generate_multi_interpolation_plot
+from utils.dynamic_cartesian_plot import generate_multi_interpolation_plot, generate_line_traces, compute_line_result
 from utils.dynamic_cartesian_plot import generate_eval_history_plot
+from utils.interpolator_sync import sync_interpolator
+from utils.result_cache import LRUCache, canonical_points
+from algorithms.memory import measure_peak_memory
 
 class GraphOutputPanel(ft.Container):
+    INTERPOLATORS = {"Lagrange": LagrangeInterpolator, "Newton": NewtonInterpolator, "Barycentric": BarycentricInterpolator}
+    NUM_SAMPLES = 1000
+    TRACE_PEAK_MEMORY = False
+
     def __init__(self):
         super().__init__(padding=10, alignment=ft.alignment.top_left, expand=True)
 
@@ -28,6 +35,11 @@ class GraphOutputPanel(ft.Container):
 
         self.eval_times = []
         self.current_dataset_hash = None
+        self.live_interpolators = {}
+        self.line_states = {}
+        self.reused_lines = 0
+        self.line_cache = LRUCache(max_entries=128)
+        self.render_cache = LRUCache(max_entries=16)
         self.show_eval_graph = False
 
         self.eval_button = ft.TextButton("⏱ Show Eval History", on_click=self.toggle_eval_graph)
@@ -50,86 +62,127 @@ class GraphOutputPanel(ft.Container):
     def on_interpolator_change(self, e):
         self.selected_interpolator = e.control.value
 
-    def update_output(self, datasets):
+    def update_output(self, datasets, job=None):
         """
         datasets: List of dicts with keys:
             - x_vals
             - y_vals
             - label (optional)
             - color (optional)
+            - line_id, revision (optional): skip recomputing lines whose revision is unchanged
         """
-        dataset_hash = hashlib.md5(str(datasets).encode()).hexdigest()
+        dataset_hash = hashlib.md5(str([(data.get("x_vals"), data.get("y_vals"), data.get("label"), data.get("color")) for data in datasets]).encode()).hexdigest()
 
         if dataset_hash != self.current_dataset_hash:
             self.eval_times = []
             self.current_dataset_hash = dataset_hash
 
-        html_url, total_eval_time, max_stability, memory_usage = self.compute_interpolations(datasets)
+        self.info_line.value = "Computing..."
+        self.update()
+
+        peak_memory = None
+        if self.TRACE_PEAK_MEMORY:
+            outputs, peak_memory = measure_peak_memory(self.compute_interpolations, datasets, job)
+        else:
+            outputs = self.compute_interpolations(datasets, job)
+        html_url, total_eval_time, max_stability, memory_usage = outputs
 
+        # None means every line came from a cache, so nothing was evaluated this time.
         if total_eval_time is not None:
             self.eval_times.append(total_eval_time)
 
-        self.update_info_line(total_eval_time, max_stability, memory_usage)
+        self.update_info_line(total_eval_time, max_stability, memory_usage, peak_memory)
         self.update_eval_history_ui()
         self.update_graph_ui(html_url)
 
-    def compute_interpolations(self, datasets):
+    def compute_interpolations(self, datasets, job=None):
         interpolated_data = []
+        total_eval_time = None
 
         for i, data in enumerate(datasets):
+            if job:
+                job.raise_if_cancelled()
+
             x_vals = data.get("x_vals", [])
             y_vals = data.get("y_vals", [])
 
             if not x_vals or not y_vals or len(x_vals) <= 1:
                 continue
 
-            if self.selected_interpolator == "Lagrange":
-                interpolator = LagrangeInterpolator(x_vals, y_vals)
-                print(f"Using Lagrange Interpolator for {data.get('label', f'Line {i+1}')}")
-            elif self.selected_interpolator == "Newton":
-                interpolator = NewtonInterpolator(x_vals, y_vals)
-                print(f"Using Newton Interpolator for {data.get('label', f'Line {i+1}')}")
-            elif self.selected_interpolator == "Barycentric":
-                interpolator = BarycentricInterpolator(x_vals, y_vals)
-                print(f"Using Barycentric Interpolator for {data.get('label', f'Line {i+1}')}")
-            
-            interpolated_data.append({
+            line_id = data.get("line_id", i)
+            revision = data.get("revision")
+            state = self.line_states.get(line_id)
+            if state and revision is not None and state["revision"] == revision and state["algorithm"] == self.selected_interpolator:
+                self.reused_lines += 1
+                interpolated_data.append(state["data"])
+                continue
+
+            cache_key = (canonical_points(x_vals, y_vals), self.selected_interpolator, self.NUM_SAMPLES)
+            entry = self.line_cache.get(cache_key)
+            if entry is None:
+                key = (line_id, self.selected_interpolator)
+                interpolator_class = self.INTERPOLATORS[self.selected_interpolator]
+                interpolator = sync_interpolator(self.live_interpolators.get(key), interpolator_class, x_vals, y_vals)
+                self.live_interpolators[key] = interpolator
+                print(f"Using {self.selected_interpolator} Interpolator for {data.get('label', f'Line {i+1}')}")
+
+                result = compute_line_result(interpolator, x_vals, self.NUM_SAMPLES)
+                total_eval_time = (total_eval_time or 0.0) + result["eval_time"]
+                entry = {"interpolator": copy.deepcopy(interpolator), "result": result}
+                self.line_cache.put(cache_key, entry)
+
+            line_data = {
                 "x_vals": x_vals,
                 "y_vals": y_vals,
-                "interpolator": interpolator,
+                "cache_key": cache_key,
+                "interpolator": entry["interpolator"],
+                "result": entry["result"],
                 "label": data.get("label", f"Line {i+1}"),
                 "color": data.get("color")
-            })
+            }
+            line_data["traces"] = generate_line_traces(line_data, i)
 
-        if not interpolated_data:
-            return None
+            self.line_states[line_id] = {"revision": revision, "algorithm": self.selected_interpolator, "data": line_data}
+            interpolated_data.append(line_data)
 
-        html, total_eval_time, max_stability, memory_usage = generate_multi_interpolation_plot(interpolated_data)
+        active_ids = {data.get("line_id", i) for i, data in enumerate(datasets)}
+        self.line_states = {line_id: state for line_id, state in self.line_states.items() if line_id in active_ids}
+        self.live_interpolators = {key: value for key, value in self.live_interpolators.items() if key[0] in active_ids}
 
-        output_dir = SERVE_DIR
-        os.makedirs(output_dir, exist_ok=True)
+        if not interpolated_data:
+            return None
 
-        filename = "graph.html"
-        filepath = os.path.join(output_dir, filename)
+        render_key = tuple((data["cache_key"], data["label"], data["color"], tuple(data["x_vals"])) for data in interpolated_data)
+        graph_id = hashlib.md5(str(render_key).encode()).hexdigest()[:16]
+        register_graph(graph_id, [(data["interpolator"], min(data["x_vals"]), max(data["x_vals"])) for data in interpolated_data])
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html)
-            print(f"Graph saved to {filepath}")
+        rendered = self.render_cache.get(render_key)
+        if rendered is None:
+            rendered = generate_multi_interpolation_plot(interpolated_data, graph_id)
+            self.render_cache.put(render_key, rendered)
+        html, _, max_stability, memory_usage = rendered
+        if job:
+            job.raise_if_cancelled()
 
-        return f"http://localhost:8000/{filename}", total_eval_time, max_stability, memory_usage
+        return publish_artifact("graph.html", html), total_eval_time, max_stability, memory_usage
     
-    def update_info_line(self, total_eval_time, max_stability, memory_usage):
-        if total_eval_time is None or max_stability is None:
+    def update_info_line(self, total_eval_time, max_stability, memory_usage, peak_memory=None):
+        if max_stability is None:
             self.info_line.value = "No Information Found"
         else:
-            if total_eval_time < 1:
+            if total_eval_time is None:
+                eval_display = "cached"
+            elif total_eval_time < 1:
                 eval_display = f"{total_eval_time * 1000:.2f}ms"
             else:
                 eval_display = f"{total_eval_time:.5f}s"
 
             stability_display = f"{max_stability:.7f}"
 
-            self.info_line.value = f"Memory: {memory_usage} KB | ⏱ {eval_display} | 📈 Stability: {stability_display}"
+            cache_display = f"{self.reused_lines} reused / {self.line_cache.hits} hits / {self.line_cache.misses} misses"
+            memory_display = f"{memory_usage} KB" if peak_memory is None else f"{memory_usage} KB (peak {peak_memory} KB)"
+
+            self.info_line.value = f"Memory: {memory_display} | ⏱ {eval_display} | 📈 Stability: {stability_display} | Cache: {cache_display}"
 
         self.update()
 
@@ -152,9 +205,4 @@ class GraphOutputPanel(ft.Container):
             return
 
         html = generate_eval_history_plot(self.eval_times)
-        output_dir = SERVE_DIR
-        filepath = os.path.join(output_dir, "eval_history.html")
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(html)
-
-        self.eval_graph_container.content = ft.WebView(expand=True, url="http://localhost:8000/eval_history.html")
+        self.eval_graph_container.content = ft.WebView(expand=True, url=publish_artifact("eval_history.html", html))
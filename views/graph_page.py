@@ -1,12 +1,19 @@
 import flet as ft
 from views.graph_input_panel import GraphInputPanel
 from views.graph_output_panel import GraphOutputPanel
+from utils.job_runner import JobRunner
 from utils.validation import graph_validate_data
 
 def build_graph_page(page: ft.Page):
     input_panel = GraphInputPanel()
     output_panel = GraphOutputPanel()
 
+    def on_error(ex):
+        page.open(ft.SnackBar(content=ft.Text(f"Error: {str(ex)}"), bgcolor=ft.colors.ERROR))
+        print(f"Error: {str(ex)}")
+
+    job_runner = JobRunner(on_error=on_error)
+
     def on_calculate(e):
         all_lines_data = input_panel.get_all_lines_data()
         is_valid, error_message = graph_validate_data(all_lines_data)
@@ -14,11 +21,7 @@ def build_graph_page(page: ft.Page):
             page.open(ft.SnackBar(content=ft.Text(error_message), bgcolor=ft.colors.ERROR))
             return
 
-        try:
-            output_panel.update_output(all_lines_data)
-        except Exception as ex:
-            page.open(ft.SnackBar(content=ft.Text(f"Error: {str(ex)}"), bgcolor=ft.colors.ERROR))
-            print(f"Error: {str(ex)}")
+        job_runner.submit(output_panel.update_output, all_lines_data)
 
     input_container = ft.Container(content=input_panel.build_with_button(on_calculate, page=page), expand=1, padding=10)
     output_container = ft.Container(content=output_panel, expand=3, padding=10)